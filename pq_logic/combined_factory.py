@@ -64,12 +64,13 @@ from pq_logic.keys.trad_key_factory import (
 )
 from pq_logic.keys.xwing import XWingPrivateKey, XWingPublicKey
 from pq_logic.tmp_oids import (
-    CHEMPAT_OID_2_NAME,
     COMPOSITE_KEM05_OID_2_NAME,
     COMPOSITE_KEM06_OID_2_NAME,
     COMPOSITE_SIG04_NAME_2_OID,
     COMPOSITE_SIG04_OID_2_NAME,
+    get_chempat_name,
     id_rsa_kem_spki,
+    intern_oid,
 )
 from resources.asn1utils import try_decode_pyasn1
 from resources.convertutils import ensure_is_kem_pub_key
@@ -399,7 +400,8 @@ class CombinedKeyFactory:
 
         spki: rfc5280.SubjectPublicKeyInfo
 
-        oid = spki["algorithm"]["algorithm"]
+        # Interned, so the lookups below match the table keys by identity.
+        oid = intern_oid(spki["algorithm"]["algorithm"])
 
         if oid in COMPOSITE_SIG04_OID_2_NAME:
             return CombinedKeyFactory._get_comp_sig04_key(oid, spki["subjectPublicKey"].asOctets())
@@ -413,7 +415,7 @@ class CombinedKeyFactory:
         if oid in COMPOSITE_KEM05_OID_2_NAME:
             return CombinedKeyFactory.load_composite_kem_key(spki)
 
-        if oid in CHEMPAT_OID_2_NAME or oid in CHEMPAT_OID_2_NAME:
+        if get_chempat_name(oid) is not None:
             return CombinedKeyFactory.load_chempat_key(spki)
 
         if oid in PQ_OID_2_NAME or str(oid) in PQ_OID_2_NAME:
@@ -509,7 +511,7 @@ class CombinedKeyFactory:
         :raises KeyError: If the key OID is invalid.
         """
         oid = spki["algorithm"]["algorithm"]
-        alg_name = CHEMPAT_OID_2_NAME.get(oid)
+        alg_name = get_chempat_name(oid)
         if alg_name is None:
             raise KeyError(f"Invalid Chempat key OID: {oid}")
         raw_bytes = spki["subjectPublicKey"].asOctets()
@@ -3,34 +3,36 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import hashlib
+
 from cryptography.hazmat.primitives import hashes
 
+# hashlib is used for the one-shot helpers, because it hashes directly through
+# OpenSSL without the per-call object setup of `cryptography`'s `hashes.Hash`.
+
 def _compute_hash(algorithm: str, data: bytes) -> bytes:
     """Compute hash of the input data."""
     if algorithm == 'sha256':
-        hasher = hashes.Hash(hashes.SHA256())
+        return hashlib.sha256(data).digest()
 
     elif algorithm == 'sha512':
-        hasher = hashes.Hash(hashes.SHA512())
+        return hashlib.sha512(data).digest()
 
     elif algorithm  == 'sha3_256':
-        hasher = hashes.Hash(hashes.SHA3_256())
+        return hashlib.sha3_256(data).digest()
 
     elif algorithm == 'sha3_512':
-        hasher = hashes.Hash(hashes.SHA3_512())
+        return hashlib.sha3_512(data).digest()
 
     elif algorithm == 'shake128':
-        hasher = hashes.Hash(hashes.SHAKE128(32))
+        return hashlib.shake_128(data).digest(32)
 
     elif algorithm == 'shake256':
-        hasher = hashes.Hash(hashes.SHAKE256(64))
+        return hashlib.shake_256(data).digest(64)
 
     else:
         raise ValueError(f"Unsupported algorithm got: {algorithm}")
 
-    hasher.update(data)
-    return hasher.finalize()
-
 def _compute_shake(algorithm: str, data: bytes, length: int) -> bytes:
     """Compute SHAKE128 or SHAKE256 hash of the input data."""
     if algorithm not in ['shake128', 'shake256']:
@@ -40,11 +42,8 @@ def _compute_shake(algorithm: str, data: bytes, length: int) -> bytes:
     if length < 0:
         raise ValueError("Length must be non-negative integer.")
     if algorithm == 'shake128':
-        hasher = hashes.Hash(hashes.SHAKE128(length))
-    else:
-        hasher = hashes.Hash(hashes.SHAKE256(length))
-    hasher.update(data)
-    return hasher.finalize()
+        return hashlib.shake_128(data).digest(length)
+    return hashlib.shake_256(data).digest(length)
 
 class XOFHash:
     """XOF hash object for SHAKE128 and SHAKE256."""
@@ -17,16 +17,25 @@
 # from test_mldsa import test_mldsa
 #   hash functions
 
+import functools
+import hashlib
 from typing import Optional, Tuple
 
 # from Crypto.Hash import SHA256, SHA512, SHAKE128
-from cryptography.hazmat.primitives import hashes
 
-from pq_logic.fips._fips_utils import XOFHash, _compute_shake, _compute_hash
+from pq_logic.fips._fips_utils import _compute_shake, _compute_hash
 
 ML_DSA_Q = 8380417
 ML_DSA_N = 256
 
+#   SHAKE block sizes (rates) in bytes, used to size the bulk squeezes
+SHAKE128_RATE = 168
+SHAKE256_RATE = 136
+
+#   translation tables between bit arrays and ASCII binary strings
+_BITS_TO_ASCII = bytes.maketrans(b"\x00\x01", b"01")
+_ASCII_TO_BITS = bytes.maketrans(b"01", b"\x00\x01")
+
 #   Appendix B - Zetas Array
 
 ML_DSA_ZETAS = [
@@ -290,6 +299,12 @@ ML_DSA_ZETAS = [
 
 #   zetas = [ (1753 ** self.bitrev8(i)) % ML_DSA_Q for i in range(256) ]
 
+#   negated zetas for the inverse NTT, computed once at import
+ML_DSA_NEG_ZETAS = tuple((-z) % ML_DSA_Q for z in ML_DSA_ZETAS)
+
+#   BitRev8 lookup table
+_BITREV8 = bytes(int(f"{i:08b}"[::-1], 2) for i in range(256))
+
 #   Sect 4, Table 1. ML-DSA parameter sets
 
 #   (d, tau, lam, gam1, gam2, k, ell, eta, beta, omega)
@@ -310,18 +325,20 @@ class ML_DSA:
             raise ValueError(
                 f"The parameter set is not supported.: {param}.Supported parameter sets are: {ML_DSA_PARAM.keys()}"
             )
+        self.param = param
         self.q = ML_DSA_Q
         self.n = ML_DSA_N
         (self.d, self.tau, self.lam, self.gam1, self.gam2, self.k, self.ell, self.eta, self.beta, self.omega) = (
             ML_DSA_PARAM[param]
         )
+        # encoding sizes used by the key and signature (de)serialization
+        self._pk_t1_bitlen = int(self.q - 1).bit_length() - self.d
+        self._sk_eta_bytes = 32 * int(2 * self.eta).bit_length()
+        self._sig_z_bytes = 32 * (1 + int(self.gam1 - 1).bit_length())
 
     #   3.7 Use of Symmetric Cryptography
     def h(self, s, length):
-        xof = hashes.SHAKE256(length)
-        hasher = hashes.Hash(xof)
-        hasher.update(s)
-        return hasher.finalize()
+        return hashlib.shake_256(s).digest(length)
 
     #   Algorithm 2, ML-DSA.Sign(sk, M, ctx)
     #   XXX: Not covered by test vectors.
@@ -460,13 +477,14 @@ class ML_DSA:
         # print('# s1:', s1)
         # print('# s2:', s2)
 
-        s1h = [self.ntt(v) for v in s1]
+        s1h = self.ntt_batch(s1)
         # print('# s1Hat:', s1h)
 
         t = self.matrix_vector_ntt(ah, s1h)
         # print('# aHat*s1Hat:', t)
 
-        t = [self.add(self.ntt_inverse(t[i]), s2[i]) for i in range(self.k)]
+        # power2round reduces its input, so the sum can stay unreduced
+        t = [self._add_lazy(ti, s2[i]) for i, ti in enumerate(self.ntt_inverse_batch(t, inplace=True))]
         # print('# t:', t)
 
         (t1, t0) = self.power2round(t)
@@ -507,12 +525,13 @@ class ML_DSA:
         # print('# tr:', tr.hex())
         # print('# rnd:', rnd.hex())
 
-        s1h = [self.ntt(s1i) for s1i in s1]
-        # print('# s1Hat:', s1h)
-        s2h = [self.ntt(s2i) for s2i in s2]
-        # print('# s2Hat:', s2h)
-        t0h = [self.ntt(t0i) for t0i in t0]
+        # the decoded s1, s2 and t0 are only needed in the NTT domain
+        s12h = self.ntt_batch(s1 + s2, inplace=True)
+        # print('# s1Hat:', s12h[: self.ell])
+        # print('# s2Hat:', s12h[self.ell :])
+        t0h = self.ntt_batch(t0, inplace=True)
         # print('# t0Hat:', t0h)
+        # s1 and s2 are multiplied by the same challenge in every iteration
 
         ah = self.expand_a(rho)
         # print('# aHat:', ah)
@@ -529,12 +548,12 @@ class ML_DSA:
             y = self.expand_mask(rhopp, kappa)
             # print('# y:', y)
 
-            yh = [self.ntt(yi) for yi in y]
+            yh = self.ntt_batch(y)
             # print('# NTT(y):', yh)
 
             w = self.matrix_vector_ntt(ah, yh)
             # print('# aHat*NTT(y):', w)
-            w = [self.ntt_inverse(wi) for wi in w]
+            w = self.ntt_inverse_batch(w, inplace=True)
             # print('# w:', w)
 
             w1 = self.high_bits(w)
@@ -552,16 +571,19 @@ class ML_DSA:
             ch = self.ntt(c)
             # print('# cHat:', ch)
 
-            cs1 = [self.ntt_inverse(self.mul_ntt(ch, s1i)) for s1i in s1h]
+            cs12 = self.ntt_inverse_batch([self.mul_ntt(ch, si) for si in s12h], inplace=True)
+            cs1 = cs12[: self.ell]
             # print('# cs1:', cs1)
-            cs2 = [self.ntt_inverse(self.mul_ntt(ch, s2i)) for s2i in s2h]
+            cs2 = cs12[self.ell :]
             # print('# cs2:', cs2)
 
-            z = [self.add(y[i], cs1[i]) for i in range(self.ell)]
+            # z, w - cs2 and w - cs2 + ct0 are only consumed by functions which
+            # reduce modulo q themselves (inf_norm, low_bits, make_hint)
+            z = [self._add_lazy(y[i], cs1[i]) for i in range(self.ell)]
             # print('# z:', z)
 
-            r0 = [self.sub(w[i], cs2[i]) for i in range(self.k)]
-            r0 = self.low_bits(r0)
+            w_cs2 = [self._sub_lazy(w[i], cs2[i]) for i in range(self.k)]
+            r0 = self.low_bits(w_cs2)
             # print('# r0:', r0)
 
             z_norm = self.inf_norm(z)
@@ -574,11 +596,11 @@ class ML_DSA:
                 # print('# norm check fail')
                 (z, h) = (None, None)
             else:
-                ct0 = [self.ntt_inverse(self.mul_ntt(ch, t0i)) for t0i in t0h]
+                ct0 = self.ntt_inverse_batch([self.mul_ntt(ch, t0i) for t0i in t0h], inplace=True)
                 # print('# ct0:', ct0)
                 ct0n = [self.neg(ct0i) for ct0i in ct0]
                 # print('# -ct0:', ct0n)
-                h_r = [self.add(self.sub(w[i], cs2[i]), ct0[i]) for i in range(self.k)]
+                h_r = [self._add_lazy(w_cs2[i], ct0[i]) for i in range(self.k)]
                 # print('# w - cs2 + ct0:', h_r)
                 h = self.make_hint(ct0n, h_r)
                 # print('# h', h)
@@ -591,7 +613,9 @@ class ML_DSA:
                     (z, h) = (None, None)
             kappa += self.ell
 
-        z = [[self.modpm(x, self.q) for x in zi] for zi in z]
+        q = self.q
+        half_q = q // 2
+        z = [[half_q - (half_q - x) % q for x in zi] for zi in z]
         sig = self.sig_encode(ct, z, h)
         # print('# sig:', sig.hex())
 
@@ -635,13 +659,14 @@ class ML_DSA:
         c = self.sample_in_ball(ct)
         # print('# c:', c)
 
-        zh = [self.ntt(zi) for zi in z]
+        zh = self.ntt_batch(z)
         # print('# zHat:', zh)
 
         wp = self.matrix_vector_ntt(ah, zh)
         # print('# aHat*NTT(z):', wp)
 
-        th = [self.ntt([x << self.d for x in t1i]) for t1i in t1]
+        d = self.d
+        th = self.ntt_batch([[x << d for x in t1i] for t1i in t1], inplace=True)
         # print('# NTT(t1*2^d):', th)
 
         ch = self.ntt(c)
@@ -650,7 +675,7 @@ class ML_DSA:
         th = [self.mul_ntt(ch, thi) for thi in th]
         # print('# NTT(c)*NTT(t1*2^d):', th)
 
-        wp = [self.ntt_inverse(self.sub(wp[i], th[i])) for i in range(self.k)]
+        wp = self.ntt_inverse_batch([self._sub_lazy(wp[i], th[i]) for i in range(self.k)], inplace=True)
         # print('# wPrimeApprox:', wp)
 
         w1p = self.use_hint(h, wp)
@@ -693,25 +718,21 @@ class ML_DSA:
     #   Algorithm 12, BitsToBytes(y)
 
     def bits_to_bytes(self, y):
+        # the bits are read as a little-endian binary string in one C-level pass
         alpha = len(y)
-        z = bytearray(alpha // 8)
-        for i in range(0, alpha, 8):
-            x = 0
-            for j in range(8):
-                x += y[i + j] << j
-            z[i // 8] = x
-        return z
+        if alpha == 0:
+            return bytearray()
+        x = int(bytes(y).translate(_BITS_TO_ASCII)[::-1], 2)
+        return bytearray(x.to_bytes(alpha // 8, "little"))
 
     #   Algorithm 13, BytesToBits(z)
 
     def bytes_to_bits(self, z):
         alpha = len(z)
-        y = bytearray(8 * alpha)
-        for i in range(alpha):
-            x = z[i]
-            for j in range(8):
-                y[8 * i + j] = (x >> j) & 1
-        return y
+        if alpha == 0:
+            return bytearray()
+        y = format(int.from_bytes(z, "little"), f"0{8 * alpha}b")[::-1]
+        return bytearray(y.encode().translate(_ASCII_TO_BITS))
 
     #   Algorithm 14, CoeffFromThreeBytes(b0, b1, b2)
 
@@ -735,42 +756,42 @@ class ML_DSA:
             return None
 
     #   Algorithm 16, SimpleBitPack(w, b)
+    #   Algorithms 16-19 shift the coefficients through a single Python int
+    #   instead of building the intermediate bit string.
 
     def simple_bit_pack(self, w, b):
-        z = bytearray(0)
         bitlen_b = int(b).bit_length()
-        for i in range(256):
-            z += self.integer_to_bits(w[i], bitlen_b)
-        return self.bits_to_bytes(z)
+        mask = (1 << bitlen_b) - 1
+        x = 0
+        for i in range(255, -1, -1):
+            x = (x << bitlen_b) | (w[i] & mask)
+        return bytearray(x.to_bytes(32 * bitlen_b, "little"))
 
     #   Algorithm 17, BitPack(w, a, b)
 
     def bit_pack(self, w, a, b):
         c = int(a + b).bit_length()
-        z = bytearray(0)
-        for wi in w:
-            z += self.integer_to_bits(b - wi, c)
-        return self.bits_to_bytes(z)
+        mask = (1 << c) - 1
+        x = 0
+        for wi in reversed(w):
+            x = (x << c) | ((b - wi) & mask)
+        return bytearray(x.to_bytes(32 * c, "little"))
 
     #   Algorithm 18, SimpleBitUnpack(v, b)
 
     def simple_bit_unpack(self, v, b):
         c = int(b).bit_length()
-        z = self.bytes_to_bits(v)
-        w = [None] * 256
-        for i in range(256):
-            w[i] = self.bits_to_integer(z[i * c : (i + 1) * c], c)
-        return w
+        mask = (1 << c) - 1
+        x = int.from_bytes(v, "little")
+        return [(x >> (c * i)) & mask for i in range(256)]
 
     #   Algorithm 19, BitUnpack(v, a, b)
 
     def bit_unpack(self, v, a, b):
         c = int(a + b).bit_length()
-        z = self.bytes_to_bits(v)
-        w = []
-        for i in range(256):
-            w += [b - self.bits_to_integer(z[i * c : (i + 1) * c], c)]
-        return w
+        mask = (1 << c) - 1
+        x = int.from_bytes(v, "little")
+        return [b - ((x >> (c * i)) & mask) for i in range(256)]
 
     #   Algorithm 20, HintBitPack(h)
 
@@ -778,10 +799,9 @@ class ML_DSA:
         idx = 0
         y = bytearray(self.omega + self.k)
         for i in range(self.k):
-            for j in range(256):
-                if h[i][j] != 0:
-                    y[idx] = j
-                    idx += 1
+            nz = [j for j, x in enumerate(h[i]) if x != 0]
+            y[idx : idx + len(nz)] = bytes(nz)
+            idx += len(nz)
             y[self.omega + i] = idx
         return y
 
@@ -809,7 +829,7 @@ class ML_DSA:
 
     def pk_encode(self, rho, t1):
         pk = rho
-        b = 2 ** (int(self.q - 1).bit_length() - self.d) - 1
+        b = 2**self._pk_t1_bitlen - 1
         for t1i in t1:
             pk += self.simple_bit_pack(t1i, b)
         return pk
@@ -818,7 +838,7 @@ class ML_DSA:
 
     def pk_decode(self, pk):
         rho = pk[0:32]
-        bitlen_b = int(self.q - 1).bit_length() - self.d
+        bitlen_b = self._pk_t1_bitlen
         b = 2**bitlen_b - 1
         t1 = []
         for i in range(self.k):
@@ -845,7 +865,7 @@ class ML_DSA:
         kk = sk[32:64]
         tr = sk[64:128]
         pt = 128
-        le = 32 * int(2 * self.eta).bit_length()
+        le = self._sk_eta_bytes
         s1 = []
         for i in range(self.ell):
             yi = sk[pt : pt + le]
@@ -877,7 +897,7 @@ class ML_DSA:
     #   Algorithm 27, sigDecode(sig)
 
     def sig_decode(self, sig):
-        bl = 32 * (1 + int(self.gam1 - 1).bit_length())
+        bl = self._sig_z_bytes
         cl = self.lam // 4
         ct = sig[0:cl]
         z = []
@@ -902,14 +922,19 @@ class ML_DSA:
     def sample_in_ball(self, rho):
         c = [0] * 256
         # xof = SHAKE256.new(rho)
-        xof = XOFHash("shake256")
-        xof.update(rho)
-        s = xof.read(8)
-        h = self.bytes_to_bits(s)
+        # SHAKE output is prefix-consistent, so the stream is squeezed in
+        # blocks and only recomputed longer if the rejection loop runs dry.
+        buf = _compute_shake("shake256", rho, SHAKE256_RATE)
+        h = self.bytes_to_bits(buf[:8])
+        pos = 8
         for i in range(256 - self.tau, 256):
-            j = xof.read(1)[0]
-            while j > i:
-                j = xof.read(1)[0]
+            while True:
+                if pos >= len(buf):
+                    buf = _compute_shake("shake256", rho, len(buf) + SHAKE256_RATE)
+                j = buf[pos]
+                pos += 1
+                if j <= i:
+                    break
             c[i] = c[j]
             c[j] = (-1) ** h[i + self.tau - 256]
         return c
@@ -917,31 +942,41 @@ class ML_DSA:
     #   Algorithm 30, RejNTTPoly(rho):
 
     def rej_ntt_poly(self, rho):
-        j = 0
         # print('self.rej_ntt_poly', len(rho), rho.hex())
         # g = SHAKE128.new(rho)
         # The limit must not be lower than 298 rounds,
         # if a limit must be set.
-        g = XOFHash("shake128")
-        g.update(rho)
-        a = [None] * 256
-        while j < 256:
-            s = g.read(3)
-            a[j] = self.coeff_from_three_bytes(s[0], s[1], s[2])
-            if a[j] is not None:
-                j += 1
-        return a
+        return self._rej_ntt_poly(hashlib.shake_128(rho))
+
+    def _rej_ntt_poly(self, g):
+        # `g` is a SHAKE128 object which has already absorbed the seed.
+        # CoeffFromThreeBytes is applied to the whole squeezed buffer at once;
+        # the buffer lengths are multiples of 3, so no triple is split.
+        q = self.q
+        buf = g.digest(5 * SHAKE128_RATE)
+        while True:
+            a = [
+                z
+                for z in (b0 | (b1 << 8) | ((b2 & 0x7F) << 16) for b0, b1, b2 in zip(buf[0::3], buf[1::3], buf[2::3]))
+                if z < q
+            ]
+            if len(a) >= 256:
+                return a[:256]
+            buf = g.digest(len(buf) + SHAKE128_RATE)
 
     #   Algorithm 31, RejBoundedPoly(rho)
 
     def rej_bounded_poly(self, rho):
         j = 0
         # h = SHAKE256.new(rho)
-        h = XOFHash("shake256")
-        h.update(rho)
+        buf = _compute_shake("shake256", rho, 2 * SHAKE256_RATE)
+        pos = 0
         a = [None] * 256
         while j < 256:
-            z = h.read(1)[0]
+            if pos >= len(buf):
+                buf = _compute_shake("shake256", rho, len(buf) + SHAKE256_RATE)
+            z = buf[pos]
+            pos += 1
             z0 = self.coeff_from_half_byte(z % 16)
             z1 = self.coeff_from_half_byte(z // 16)
             if z0 != None:
@@ -955,12 +990,21 @@ class ML_DSA:
     #   Algorithm 32, ExpandA(rho)
 
     def expand_a(self, rho):
+        # ExpandA is deterministic and the same rho is expanded for every
+        # signature made or verified with a key, so the matrix is cached.
+        # The cached polynomials are tuples, so they cannot be modified.
+        return [list(row) for row in _cached_expand_a(self.param, bytes(rho))]
+
+    def _expand_a(self, rho):
+        # rho is absorbed once, each entry only absorbs its two index bytes
+        base = hashlib.shake_128(rho)
         a = [[None] * self.ell for _ in range(self.k)]
         for r in range(self.k):
             for s in range(self.ell):
-                rhop = rho + self.integer_to_bytes(s, 1) + self.integer_to_bytes(r, 1)
-                a[r][s] = self.rej_ntt_poly(rhop)
-        return a
+                g = base.copy()
+                g.update(self.integer_to_bytes(s, 1) + self.integer_to_bytes(r, 1))
+                a[r][s] = tuple(self._rej_ntt_poly(g))
+        return tuple(tuple(row) for row in a)
 
     #   Algorithm 33, ExpandS(rho)
 
@@ -976,11 +1020,10 @@ class ML_DSA:
     #   Algorithm 34, ExpandMask(rho, mu)
 
     def expand_mask(self, rho, mu):
-        c = 1 + int(self.gam1 - 1).bit_length()
         y = []
         for r in range(self.ell):
             rhop = rho + self.integer_to_bytes(mu + r, 2)
-            v = self.h(rhop, 32 * c)
+            v = self.h(rhop, self._sig_z_bytes)
             y += [self.bit_unpack(v, self.gam1 - 1, self.gam1)]
         return y
 
@@ -999,10 +1042,12 @@ class ML_DSA:
 
     def inf_norm(self, x):
         if isinstance(x, list):
-            y = 0
-            for xi in x:
-                y = max(y, self.inf_norm(xi))
-            return y
+            if x and isinstance(x[0], list):
+                return max((self.inf_norm(xi) for xi in x), default=0)
+            # modpm inlined for a whole polynomial
+            q = self.q
+            half_q = q // 2
+            return max((abs(half_q - (half_q - v) % q) for v in x), default=0)
         else:
             return abs(self.modpm(x, self.q))
 
@@ -1010,63 +1055,88 @@ class ML_DSA:
     #   "PowerTwoRound is applied componentwise."
 
     def power2round(self, r):
+        q = self.q
+        d = self.d
+        alpha = 1 << d
+        half = alpha // 2
         r0vv = []
         r1vv = []
         for rr in r:
             r0v = []
             r1v = []
             for rx in rr:
-                rp = rx % self.q
-                r0 = self.modpm(rp, 1 << self.d)
-                r1 = (rp - r0) >> self.d
-                r0v += [r0]
-                r1v += [r1]
-            r0vv += [r0v]
-            r1vv += [r1v]
+                rp = rx % q
+                r0 = half - (half - rp) % alpha
+                r0v.append(r0)
+                r1v.append((rp - r0) >> d)
+            r0vv.append(r0v)
+            r1vv.append(r1v)
         return r1vv, r0vv
 
     #   Algorithm 36, Decompose(r)
 
     def decompose(self, r):
-        rp = r % self.q
-        r0 = self.modpm(rp, 2 * self.gam2)
-        if rp - r0 == self.q - 1:
+        q = self.q
+        alpha = 2 * self.gam2
+        rp = r % q
+        r0 = self.modpm(rp, alpha)
+        if rp - r0 == q - 1:
             r1 = 0
             r0 -= 1
         else:
-            r1 = (rp - r0) // (2 * self.gam2)
+            r1 = (rp - r0) // alpha
         return (r1, r0)
 
+    #   Decompose applied to a whole polynomial in one pass, with modpm inlined.
+
+    def decompose_poly(self, rr):
+        q = self.q
+        gam2 = self.gam2
+        alpha = 2 * gam2
+        r1v = []
+        r0v = []
+        for rx in rr:
+            rp = rx % q
+            r0 = gam2 - (gam2 - rp) % alpha
+            if rp - r0 == q - 1:
+                r1v.append(0)
+                r0v.append(r0 - 1)
+            else:
+                r1v.append((rp - r0) // alpha)
+                r0v.append(r0)
+        return (r1v, r0v)
+
     #   Algorithm 37, HighBits(r)
 
     def high_bits(self, r):
-        r1vv = []
-        for rr in r:
-            r1v = []
-            for rx in rr:
-                (r1, r0) = self.decompose(rx)
-                r1v += [r1]
-            r1vv += [r1v]
-        return r1vv
+        return [self.decompose_poly(rr)[0] for rr in r]
 
     #   Algorithm 38, LowBits(r)
 
     def low_bits(self, r):
-        r0vv = []
-        for rr in r:
-            r0v = []
-            for rx in rr:
-                (r1, r0) = self.decompose(rx)
-                r0v += [r0]
-            r0vv += [r0v]
-        return r0vv
+        return [self.decompose_poly(rr)[1] for rr in r]
 
     #   Algorithm 39, MakeHint(z, r)
 
     def make_hint(self, z, r):
-        r1 = self.high_bits(r)
-        v1 = self.high_bits(self.add(r, z))
-        return self.neq(r1, v1)
+        # HighBits(r) and HighBits(r + z) are compared coefficient by
+        # coefficient in one pass, without the intermediate vectors.
+        q = self.q
+        gam2 = self.gam2
+        alpha = 2 * gam2
+        h = []
+        for zi, ri in zip(z, r):
+            hi = []
+            for zx, rx in zip(zi, ri):
+                rp = rx % q
+                d = rp - gam2 + (gam2 - rp) % alpha
+                r1 = 0 if d == q - 1 else d // alpha
+                vp = (rx + zx) % q
+                d = vp - gam2 + (gam2 - vp) % alpha
+                v1 = 0 if d == q - 1 else d // alpha
+                hi.append(int(r1 != v1))
+            h.append(hi)
+        return h
 
     #   Algorithm 40, UseHint(h, r)
 
@@ -1074,34 +1144,45 @@ class ML_DSA:
         if isinstance(h[0], list):
             return [self.use_hint(h[i], r[i]) for i in range(len(h))]
         m = (self.q - 1) // (2 * self.gam2)
-        r1v = []
-        for i in range(256):
-            (r1, r0) = self.decompose(r[i])
-            if h[i] == 1 and r0 > 0:
-                r1 = (r1 + 1) % m
-            if h[i] == 1 and r0 <= 0:
-                r1 = (r1 - 1) % m
-            r1v += [r1]
-        return r1v
+        (r1v, r0v) = self.decompose_poly(r)
+        return [
+            r1 if hi != 1 else ((r1 + 1) % m if r0 > 0 else (r1 - 1) % m) for hi, r1, r0 in zip(h, r1v, r0v)
+        ]
 
     #   Algorithm 41, NTT(w)
 
     def ntt(self, w):
-        w = w.copy()
+        return self.ntt_batch([w])[0]
+
+    def ntt_batch(self, ws, inplace: bool = False):
+        """Compute the NTT of several polynomials at once.
+
+        The butterfly schedule is the same for every polynomial, so each
+        zeta is looked up once per block and applied to all of them.
+
+        :param ws: The polynomials to transform.
+        :param inplace: Whether the input lists may be overwritten instead of copied. Defaults to `False`.
+        :return: The transformed polynomials.
+        """
+        if not inplace:
+            ws = [list(w) for w in ws]
+        q = self.q
         m = 0
         le = 128
         while le >= 1:
-            st = 0
-            while st < 256:
+            for st in range(0, 256, 2 * le):
                 m += 1
                 z = ML_DSA_ZETAS[m]
-                for j in range(st, st + le):
-                    t = (z * w[j + le]) % self.q
-                    w[j + le] = (w[j] - t) % self.q
-                    w[j] = (w[j] + t) % self.q
-                st = st + 2 * le
+                block = range(st, st + le)
+                for w in ws:
+                    for j in block:
+                        a = w[j]
+                        t = (z * w[j + le]) % q
+                        w[j + le] = a - t
+                        w[j] = a + t
             le = le // 2
-        return w
+        # the sums and differences are reduced lazily, Python ints cannot overflow
+        return [[x % q for x in w] for w in ws]
 
     #   Algorithm 42, NTT^-1(w)
 
@@ -1111,41 +1192,64 @@ class ML_DSA:
         :param w: The weights.
         :return: The result of the inverse NTT.
         """
-        w = w.copy()
+        return self.ntt_inverse_batch([w])[0]
+
+    def ntt_inverse_batch(self, ws, inplace: bool = False):
+        """Compute the inverse NTT of several polynomials at once.
+
+        :param ws: The polynomials to transform.
+        :param inplace: Whether the input lists may be overwritten instead of copied. Defaults to `False`.
+        :return: The transformed polynomials.
+        """
+        if not inplace:
+            ws = [list(w) for w in ws]
+        q = self.q
         m = 256
         le = 1
         while le < 256:
-            st = 0
-            while st < 256:
+            for st in range(0, 256, 2 * le):
                 m -= 1
-                z = -ML_DSA_ZETAS[m]
-                for j in range(st, st + le):
-                    t = w[j]
-                    w[j] = (t + w[j + le]) % self.q
-                    w[j + le] = (t - w[j + le]) % self.q
-                    w[j + le] = (z * w[j + le]) % self.q
-                st = st + 2 * le
+                z = ML_DSA_NEG_ZETAS[m]
+                block = range(st, st + le)
+                for w in ws:
+                    for j in block:
+                        t = w[j]
+                        u = w[j + le]
+                        w[j] = t + u
+                        w[j + le] = (z * (t - u)) % q
             le = 2 * le
         f = 8347681
-        w = [(f * w[j]) % self.q for j in range(256)]
-        return w
+        return [[(f * x) % q for x in w] for w in ws]
 
     #   Algorithm 43, BitRev8(m)
 
     def bitrev8(self, m):
-        b = self.integer_to_bits(m, 8)
-        brev = [b[7 - i] for i in range(8)]
-        r = self.bits_to_integer(brev, 8)
-        return r
+        return _BITREV8[m]
 
     #   Algorithm 44, AddNTT(a, b)
 
+    #   The helpers below take scalars, polynomials or vectors of polynomials;
+    #   a polynomial is handled with a single comprehension instead of recursing
+    #   down to every coefficient.
+
     def add(self, a, b):
         if isinstance(a, list):
-            return [self.add(a[i], b[i]) for i in range(len(a))]
+            if a and isinstance(a[0], list):
+                return [self.add(ai, bi) for ai, bi in zip(a, b)]
+            q = self.q
+            return [(x + y) % q for x, y in zip(a, b)]
         else:
             return (a + b) % self.q
 
+    #   addition and subtraction of two polynomials without the reduction modulo q,
+    #   for results which are only passed on to functions that reduce anyway
+
+    def _add_lazy(self, a, b):
+        return [x + y for x, y in zip(a, b)]
+
+    def _sub_lazy(self, a, b):
+        return [x - y for x, y in zip(a, b)]
+
     #   negation
 
     def neg(self, a):
@@ -1155,7 +1259,10 @@ class ML_DSA:
         :return:
         """
         if isinstance(a, list):
-            return [self.neg(a[i]) for i in range(len(a))]
+            if a and isinstance(a[0], list):
+                return [self.neg(ai) for ai in a]
+            q = self.q
+            return [(-x) % q for x in a]
         else:
             return (-a) % self.q
 
@@ -1169,7 +1276,10 @@ class ML_DSA:
         :return: The result of the subtraction.
         """
         if isinstance(a, list):
-            return [self.sub(a[i], b[i]) for i in range(len(a))]
+            if a and isinstance(a[0], list):
+                return [self.sub(ai, bi) for ai, bi in zip(a, b)]
+            q = self.q
+            return [(x - y) % q for x, y in zip(a, b)]
         else:
             return (a - b) % self.q
 
@@ -1183,7 +1293,9 @@ class ML_DSA:
         :return: The result of the not equivalent operation.
         """
         if isinstance(a, list):
-            return [self.neq(a[i], b[i]) for i in range(len(a))]
+            if a and isinstance(a[0], list):
+                return [self.neq(ai, bi) for ai, bi in zip(a, b)]
+            return [int(x != y) for x, y in zip(a, b)]
         elif a == b:
             return 0
         else:
@@ -1193,10 +1305,9 @@ class ML_DSA:
 
     def weight(self, a):
         if isinstance(a, list):
-            w = 0
-            for ai in a:
-                w += self.weight(ai)
-            return w
+            if a and isinstance(a[0], list):
+                return sum(self.weight(ai) for ai in a)
+            return len(a) - a.count(0)
         elif a == 0:
             return 0
         else:
@@ -1205,13 +1316,24 @@ class ML_DSA:
     #   Algorithm 45, MulNTT(a, b)
 
     def mul_ntt(self, a, b):
-        return [(a[i] * b[i]) % self.q for i in range(256)]
+        q = self.q
+        return [(x * y) % q for x, y in zip(a, b)]
 
     #   Algorithm 48, MatrixVectorNTT(M^, v^)
 
     def matrix_vector_ntt(self, m, v):
-        w = [[0] * 256 for _ in range(self.k)]
+        # accumulate the row products unreduced and reduce once per coefficient
+        q = self.q
+        w = []
         for i in range(self.k):
+            acc = [0] * 256
             for j in range(self.ell):
-                w[i] = self.add(w[i], self.mul_ntt(m[i][j], v[j]))
+                acc = [s + x * y for s, x, y in zip(acc, m[i][j], v[j])]
+            w.append([s % q for s in acc])
         return w
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_expand_a(param: str, rho: bytes):
+    """Return the ExpandA matrix for the parameter set and seed, computed once per pair."""
+    return ML_DSA(param)._expand_a(rho)
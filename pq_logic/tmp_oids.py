@@ -8,54 +8,92 @@ Which may change in the future or are replaced be different OIDs or updated for
 version.
 """
 
+from types import MappingProxyType
+from typing import Dict, Final, Optional, Tuple
+
 from pyasn1.type import univ
 from pyasn1_alt_modules import rfc5990, rfc9480
 
+# Cache for the OIDs defined in this module, keyed by their arcs, so that every
+# OID is only constructed once and the same instance is shared by all tables.
+_OID_INTERN: Dict[Tuple[int, ...], univ.ObjectIdentifier] = {}
+
+
+def _oid(arcs: Tuple[int, ...]) -> univ.ObjectIdentifier:
+    """Return the interned `ObjectIdentifier` for the given arcs.
+
+    :param arcs: The arcs of the OID.
+    :return: The cached `ObjectIdentifier` instance.
+    """
+    oid = _OID_INTERN.get(arcs)
+    if oid is None:
+        oid = univ.ObjectIdentifier(arcs)
+        _OID_INTERN[arcs] = oid
+    return oid
+
+
+def intern_oid(oid: univ.ObjectIdentifier) -> univ.ObjectIdentifier:
+    """Return the instance defined in this module for a known OID.
+
+    Decoded OIDs are new instances, so a lookup in the tables of this module has to
+    compare the arcs. With the module-level instance, the lookup matches by identity.
+
+    :param oid: The OID to intern, e.g., decoded from a structure.
+    :return: The module-level instance with the same arcs, or the given OID if unknown.
+    """
+    return _OID_INTERN.get(oid.asTuple(), oid)
+
+
 ##############################
 # Test Suite OIDs
 ##############################
 
-# Define the OID for the test suite oids.
-id_test_suite_oid = f"{rfc9480.id_it}.9996.9999"
+# Define the OID for the test suite oids (`id-it.9996.9999`).
+# The test suite bases are kept as literal arc tuples, so that the leaves are built by
+# tuple concatenation instead of re-parsing the dotted string for every OID.
+id_test_suite_oid: Final = (1, 3, 6, 1, 5, 5, 7, 4, 9996, 9999)
+assert id_test_suite_oid[:-2] == rfc9480.id_it.asTuple(), "The test suite OIDs must be below `id-it`."
 
 # Define the OID for the test suite KEM
 
-id_kem_test_suite = f"{id_test_suite_oid}.2"
+id_kem_test_suite = id_test_suite_oid + (2,)
 
 # Define the OID for the hybrid KEM test suite.
-id_hybrid_kems_test_suite = f"{id_test_suite_oid}.3"
+id_hybrid_kems_test_suite = id_test_suite_oid + (3,)
 
 # Define the OID for the hybrid signature test suite.
-id_hybrid_sig_test_suite = f"{id_test_suite_oid}.4"
+id_hybrid_sig_test_suite = id_test_suite_oid + (4,)
 
 
 # Hybrid KEM's.
-id_composite_kem_test_suite = f"{id_hybrid_kems_test_suite}.1"
-id_Chempat = f"{id_hybrid_kems_test_suite}.2"
+id_composite_kem_test_suite = id_hybrid_kems_test_suite + (1,)
+id_Chempat = id_hybrid_kems_test_suite + (2,)
 
 
 # Hybrid Signature's.
 
-id_composite_sig_test_suite = f"{id_hybrid_sig_test_suite}.1"
+id_composite_sig_test_suite = id_hybrid_sig_test_suite + (1,)
 
 # used inside cert-binding-for-multiple-authentication.
-id_hybrid_sig_multi_auth = univ.ObjectIdentifier(f"{id_hybrid_sig_test_suite}.2")
+id_hybrid_sig_multi_auth = _oid(id_hybrid_sig_test_suite + (2,))
 
 # used inside the cert discovery method.
-id_hybrid_sig_cert_binding = univ.ObjectIdentifier(f"{id_hybrid_sig_test_suite}.3")
+id_hybrid_sig_cert_binding = _oid(id_hybrid_sig_test_suite + (3,))
 
 # OIDs used for the sun-hybrid signature method.
-id_hybrid_sun = univ.ObjectIdentifier(f"{id_hybrid_sig_test_suite}.4")
+id_hybrid_sun = _oid(id_hybrid_sig_test_suite + (4,))
 
 nist_algorithms_oid = rfc5990.nistAlgorithm
 
 # Ref: https://github.com/open-quantum-safe/oqs-provider/blob/main/ALGORITHMS.md
 
-id_falcon_512 = univ.ObjectIdentifier("1.3.9999.3.6")
-id_falcon_1024 = univ.ObjectIdentifier("1.3.9999.3.9")
+id_oqs_falcon: Final = (1, 3, 9999, 3)
+
+id_falcon_512 = _oid(id_oqs_falcon + (6,))
+id_falcon_1024 = _oid(id_oqs_falcon + (9,))
 
-id_falcon_padded_512 = univ.ObjectIdentifier("1.3.9999.3.16")
-id_falcon_padded_1024 = univ.ObjectIdentifier("1.3.9999.3.19")
+id_falcon_padded_512 = _oid(id_oqs_falcon + (16,))
+id_falcon_padded_1024 = _oid(id_oqs_falcon + (19,))
 
 
 FALCON_NAME_2_OID = {
@@ -67,29 +105,29 @@ FALCON_NAME_2_OID = {
 
 FALCON_OID_2_NAME = {y: x for x, y in FALCON_NAME_2_OID.items()}
 
-id_ntru = f"{id_kem_test_suite}.1"
-id_sntrup761_str = univ.ObjectIdentifier(f"{id_ntru}.1")
+id_ntru = id_kem_test_suite + (1,)
+id_sntrup761_str = _oid(id_ntru + (1,))
 
 
-id_mceliece = f"{id_kem_test_suite}.2"
+id_mceliece = id_kem_test_suite + (2,)
 
 MCELIECE_NAME_2_OID = {
-    "mceliece-348864": univ.ObjectIdentifier(f"{id_mceliece}.1"),
-    "mceliece-460896": univ.ObjectIdentifier(f"{id_mceliece}.2"),
-    "mceliece-6688128": univ.ObjectIdentifier(f"{id_mceliece}.3"),
-    "mceliece-6960119": univ.ObjectIdentifier(f"{id_mceliece}.4"),
-    "mceliece-8192128": univ.ObjectIdentifier(f"{id_mceliece}.5"),
+    "mceliece-348864": _oid(id_mceliece + (1,)),
+    "mceliece-460896": _oid(id_mceliece + (2,)),
+    "mceliece-6688128": _oid(id_mceliece + (3,)),
+    "mceliece-6960119": _oid(id_mceliece + (4,)),
+    "mceliece-8192128": _oid(id_mceliece + (5,)),
 }
 
-id_frodokem = f"{id_kem_test_suite}.3"
+id_frodokem = id_kem_test_suite + (3,)
 
 FRODOKEM_NAME_2_OID = {
-    "frodokem-640-aes": univ.ObjectIdentifier(f"{id_frodokem}.1"),
-    "frodokem-640-shake": univ.ObjectIdentifier(f"{id_frodokem}.2"),
-    "frodokem-976-aes": univ.ObjectIdentifier(f"{id_frodokem}.3"),
-    "frodokem-976-shake": univ.ObjectIdentifier(f"{id_frodokem}.4"),
-    "frodokem-1344-aes": univ.ObjectIdentifier(f"{id_frodokem}.5"),
-    "frodokem-1344-shake": univ.ObjectIdentifier(f"{id_frodokem}.6"),
+    "frodokem-640-aes": _oid(id_frodokem + (1,)),
+    "frodokem-640-shake": _oid(id_frodokem + (2,)),
+    "frodokem-976-aes": _oid(id_frodokem + (3,)),
+    "frodokem-976-shake": _oid(id_frodokem + (4,)),
+    "frodokem-1344-aes": _oid(id_frodokem + (5,)),
+    "frodokem-1344-shake": _oid(id_frodokem + (6,)),
 }
 
 FRODOKEM_OID_2_NAME = {y: x for x, y in FRODOKEM_NAME_2_OID.items()}
@@ -97,23 +135,23 @@ MCELIECE_OID_2_NAME = {y: x for x, y in MCELIECE_NAME_2_OID.items()}
 
 id_it_KemCiphertextInfo = rfc9480.id_it + (9999,)
 
-id_CompSig = "2.16.840.1.114027.80.8.1.1"
-id_CompKEM = "2.16.840.1.114027.80.5.2.1"
-
-id_hash_mldsa44_rsa2048_pss_sha256 = univ.ObjectIdentifier(f"{id_CompSig}.40")
-id_hash_mldsa44_rsa2048_pkcs15_sha256 = univ.ObjectIdentifier(f"{id_CompSig}.41")
-id_hash_mldsa44_ed25519_sha512 = univ.ObjectIdentifier(f"{id_CompSig}.42")
-id_hash_mldsa44_ecdsa_p256_sha256 = univ.ObjectIdentifier(f"{id_CompSig}.43")
-id_hash_mldsa65_rsa3072_pss_sha512 = univ.ObjectIdentifier(f"{id_CompSig}.44")
-id_hash_mldsa65_rsa3072_pkcs15_sha512 = univ.ObjectIdentifier(f"{id_CompSig}.45")
-id_hash_mldsa65_rsa4096_pss_sha512 = univ.ObjectIdentifier(f"{id_CompSig}.46")
-id_hash_mldsa65_rsa4096_pkcs15_sha512 = univ.ObjectIdentifier(f"{id_CompSig}.47")
-id_hash_mldsa65_ecdsa_p384_sha512 = univ.ObjectIdentifier(f"{id_CompSig}.48")
-id_hash_mldsa65_ecdsa_brainpool_p256r1_sha512 = univ.ObjectIdentifier(f"{id_CompSig}.49")
-id_hash_mldsa65_ed25519_sha512 = univ.ObjectIdentifier(f"{id_CompSig}.50")
-id_hash_mldsa87_ecdsa_p384_sha512 = univ.ObjectIdentifier(f"{id_CompSig}.51")
-id_hash_mldsa87_ecdsa_brainpool_p384r1_sha512 = univ.ObjectIdentifier(f"{id_CompSig}.52")
-id_hash_mldsa87_ed448_sha512 = univ.ObjectIdentifier(f"{id_CompSig}.53")
+id_CompSig: Final = (2, 16, 840, 1, 114027, 80, 8, 1, 1)
+id_CompKEM: Final = (2, 16, 840, 1, 114027, 80, 5, 2, 1)
+
+id_hash_mldsa44_rsa2048_pss_sha256 = _oid(id_CompSig + (40,))
+id_hash_mldsa44_rsa2048_pkcs15_sha256 = _oid(id_CompSig + (41,))
+id_hash_mldsa44_ed25519_sha512 = _oid(id_CompSig + (42,))
+id_hash_mldsa44_ecdsa_p256_sha256 = _oid(id_CompSig + (43,))
+id_hash_mldsa65_rsa3072_pss_sha512 = _oid(id_CompSig + (44,))
+id_hash_mldsa65_rsa3072_pkcs15_sha512 = _oid(id_CompSig + (45,))
+id_hash_mldsa65_rsa4096_pss_sha512 = _oid(id_CompSig + (46,))
+id_hash_mldsa65_rsa4096_pkcs15_sha512 = _oid(id_CompSig + (47,))
+id_hash_mldsa65_ecdsa_p384_sha512 = _oid(id_CompSig + (48,))
+id_hash_mldsa65_ecdsa_brainpool_p256r1_sha512 = _oid(id_CompSig + (49,))
+id_hash_mldsa65_ed25519_sha512 = _oid(id_CompSig + (50,))
+id_hash_mldsa87_ecdsa_p384_sha512 = _oid(id_CompSig + (51,))
+id_hash_mldsa87_ecdsa_brainpool_p384r1_sha512 = _oid(id_CompSig + (52,))
+id_hash_mldsa87_ed448_sha512 = _oid(id_CompSig + (53,))
 
 COMP_SIG03_PREHASH_OID_2_HASH = {
     id_hash_mldsa44_rsa2048_pss_sha256: "sha256",
@@ -133,20 +171,20 @@ COMP_SIG03_PREHASH_OID_2_HASH = {
 }
 CMS_COMPOSITE03_OID_2_HASH = {}
 
-id_mldsa44_rsa2048_pss = univ.ObjectIdentifier(f"{id_CompSig}.21")
-id_mldsa44_rsa2048_pkcs15 = univ.ObjectIdentifier(f"{id_CompSig}.22")
-id_mldsa44_ed25519 = univ.ObjectIdentifier(f"{id_CompSig}.23")
-id_mldsa44_ecdsa_p256 = univ.ObjectIdentifier(f"{id_CompSig}.24")
-id_mldsa65_rsa3072_pss = univ.ObjectIdentifier(f"{id_CompSig}.26")
-id_mldsa65_rsa3072_pkcs15 = univ.ObjectIdentifier(f"{id_CompSig}.27")
-id_mldsa65_rsa4096_pss = univ.ObjectIdentifier(f"{id_CompSig}.34")
-id_mldsa65_rsa4096_pkcs15 = univ.ObjectIdentifier(f"{id_CompSig}.35")
-id_mldsa65_ecdsa_p384 = univ.ObjectIdentifier(f"{id_CompSig}.28")
-id_mldsa65_ecdsa_brainpool_p256r1 = univ.ObjectIdentifier(f"{id_CompSig}.29")
-id_mldsa65_ed25519 = univ.ObjectIdentifier(f"{id_CompSig}.30")
-id_mldsa87_ecdsa_p384 = univ.ObjectIdentifier(f"{id_CompSig}.31")
-id_mldsa87_ecdsa_brainpool_p384r1 = univ.ObjectIdentifier(f"{id_CompSig}.32")
-id_mldsa87_ed448 = univ.ObjectIdentifier(f"{id_CompSig}.33")
+id_mldsa44_rsa2048_pss = _oid(id_CompSig + (21,))
+id_mldsa44_rsa2048_pkcs15 = _oid(id_CompSig + (22,))
+id_mldsa44_ed25519 = _oid(id_CompSig + (23,))
+id_mldsa44_ecdsa_p256 = _oid(id_CompSig + (24,))
+id_mldsa65_rsa3072_pss = _oid(id_CompSig + (26,))
+id_mldsa65_rsa3072_pkcs15 = _oid(id_CompSig + (27,))
+id_mldsa65_rsa4096_pss = _oid(id_CompSig + (34,))
+id_mldsa65_rsa4096_pkcs15 = _oid(id_CompSig + (35,))
+id_mldsa65_ecdsa_p384 = _oid(id_CompSig + (28,))
+id_mldsa65_ecdsa_brainpool_p256r1 = _oid(id_CompSig + (29,))
+id_mldsa65_ed25519 = _oid(id_CompSig + (30,))
+id_mldsa87_ecdsa_p384 = _oid(id_CompSig + (31,))
+id_mldsa87_ecdsa_brainpool_p384r1 = _oid(id_CompSig + (32,))
+id_mldsa87_ed448 = _oid(id_CompSig + (33,))
 
 PURE_COMPOSITE_SIG03_NAME_TO_OID = {
     "composite-sig-03-ml-dsa-44-rsa2048-pss": id_mldsa44_rsa2048_pss,
@@ -185,7 +223,7 @@ COMPOSITE_SIG03_HASH_NAME_2_OID = {
 }
 COMPOSITE_SIG03_HASH_OID_2_NAME = {y: x for x, y in COMPOSITE_SIG03_HASH_NAME_2_OID.items()}
 
-id_rsa_kem_spki = univ.ObjectIdentifier("1.2.840.113549.1.9.16.3")
+id_rsa_kem_spki = _oid((1, 2, 840, 113549, 1, 9, 16, 3))
 
 PURE_OID_TO_HASH = {
     id_mldsa44_rsa2048_pss: "sha256",
@@ -222,22 +260,22 @@ COMPOSITE_SIG_SIGNED_DATA_OID_HASH = {
 }
 
 
-id_compSig04_mldsa44_rsa2048_pss = univ.ObjectIdentifier(f"{id_CompSig}.60")
-id_compSig04_mldsa44_rsa2048_pkcs15 = univ.ObjectIdentifier(f"{id_CompSig}.61")
-id_compSig04_mldsa44_ed25519 = univ.ObjectIdentifier(f"{id_CompSig}.62")
-id_compSig04_mldsa44_ecdsa_p256 = univ.ObjectIdentifier(f"{id_CompSig}.63")
-id_compSig04_mldsa65_rsa3072_pss = univ.ObjectIdentifier(f"{id_CompSig}.64")
-id_compSig04_mldsa65_rsa3072_pkcs15 = univ.ObjectIdentifier(f"{id_CompSig}.65")
-id_compSig04_mldsa65_rsa4096_pss = univ.ObjectIdentifier(f"{id_CompSig}.66")
-id_compSig04_mldsa65_rsa4096_pkcs15 = univ.ObjectIdentifier(f"{id_CompSig}.67")
-id_compSig04_mldsa65_ecdsa_p256 = univ.ObjectIdentifier(f"{id_CompSig}.68")
-id_compSig04_mldsa65_ecdsa_p384 = univ.ObjectIdentifier(f"{id_CompSig}.69")
-id_compSig04_mldsa65_ecdsa_brainpool_p256r1 = univ.ObjectIdentifier(f"{id_CompSig}.70")
-id_compSig04_mldsa65_ed25519 = univ.ObjectIdentifier(f"{id_CompSig}.71")
-id_compSig04_mldsa87_ecdsa_p384 = univ.ObjectIdentifier(f"{id_CompSig}.72")
-id_compSig04_mldsa87_ecdsa_brainpool_p384r1 = univ.ObjectIdentifier(f"{id_CompSig}.73")
-id_compSig04_mldsa87_ed448 = univ.ObjectIdentifier(f"{id_CompSig}.74")
-id_compSig04_mldsa87_rsa4096_pss = univ.ObjectIdentifier(f"{id_CompSig}.75")
+id_compSig04_mldsa44_rsa2048_pss = _oid(id_CompSig + (60,))
+id_compSig04_mldsa44_rsa2048_pkcs15 = _oid(id_CompSig + (61,))
+id_compSig04_mldsa44_ed25519 = _oid(id_CompSig + (62,))
+id_compSig04_mldsa44_ecdsa_p256 = _oid(id_CompSig + (63,))
+id_compSig04_mldsa65_rsa3072_pss = _oid(id_CompSig + (64,))
+id_compSig04_mldsa65_rsa3072_pkcs15 = _oid(id_CompSig + (65,))
+id_compSig04_mldsa65_rsa4096_pss = _oid(id_CompSig + (66,))
+id_compSig04_mldsa65_rsa4096_pkcs15 = _oid(id_CompSig + (67,))
+id_compSig04_mldsa65_ecdsa_p256 = _oid(id_CompSig + (68,))
+id_compSig04_mldsa65_ecdsa_p384 = _oid(id_CompSig + (69,))
+id_compSig04_mldsa65_ecdsa_brainpool_p256r1 = _oid(id_CompSig + (70,))
+id_compSig04_mldsa65_ed25519 = _oid(id_CompSig + (71,))
+id_compSig04_mldsa87_ecdsa_p384 = _oid(id_CompSig + (72,))
+id_compSig04_mldsa87_ecdsa_brainpool_p384r1 = _oid(id_CompSig + (73,))
+id_compSig04_mldsa87_ed448 = _oid(id_CompSig + (74,))
+id_compSig04_mldsa87_rsa4096_pss = _oid(id_CompSig + (75,))
 
 COMPOSITE_SIG04_PURE_NAME_TO_OID = {
     # ML-DSA-44
@@ -262,26 +300,26 @@ COMPOSITE_SIG04_PURE_NAME_TO_OID = {
 }
 
 # Hash-based ML-DSA 44 OIDs
-composite_sig04_hash_ml_dsa_44_rsa2048_pss = univ.ObjectIdentifier(f"{id_CompSig}.80")
-composite_sig04_hash_ml_dsa_44_rsa2048_pkcs15 = univ.ObjectIdentifier(f"{id_CompSig}.81")
-composite_sig04_hash_ml_dsa_44_ed25519 = univ.ObjectIdentifier(f"{id_CompSig}.82")
-composite_sig04_hash_ml_dsa_44_ecdsa_p256 = univ.ObjectIdentifier(f"{id_CompSig}.83")
+composite_sig04_hash_ml_dsa_44_rsa2048_pss = _oid(id_CompSig + (80,))
+composite_sig04_hash_ml_dsa_44_rsa2048_pkcs15 = _oid(id_CompSig + (81,))
+composite_sig04_hash_ml_dsa_44_ed25519 = _oid(id_CompSig + (82,))
+composite_sig04_hash_ml_dsa_44_ecdsa_p256 = _oid(id_CompSig + (83,))
 
 # Hash-based ML-DSA 65 OIDs
-composite_sig04_hash_ml_dsa_65_rsa3072_pss = univ.ObjectIdentifier(f"{id_CompSig}.84")
-composite_sig04_hash_ml_dsa_65_rsa3072_pkcs15 = univ.ObjectIdentifier(f"{id_CompSig}.85")
-composite_sig04_hash_ml_dsa_65_rsa4096_pss = univ.ObjectIdentifier(f"{id_CompSig}.86")
-composite_sig04_hash_ml_dsa_65_rsa4096_pkcs15 = univ.ObjectIdentifier(f"{id_CompSig}.87")
-composite_sig04_hash_ml_dsa_65_ecdsa_p256 = univ.ObjectIdentifier(f"{id_CompSig}.88")
-composite_sig04_hash_ml_dsa_65_ecdsa_p384 = univ.ObjectIdentifier(f"{id_CompSig}.89")
-composite_sig04_hash_ml_dsa_65_ecdsa_brainpoolp256r1 = univ.ObjectIdentifier(f"{id_CompSig}.90")
-composite_sig04_hash_ml_dsa_65_ed25519 = univ.ObjectIdentifier(f"{id_CompSig}.91")
+composite_sig04_hash_ml_dsa_65_rsa3072_pss = _oid(id_CompSig + (84,))
+composite_sig04_hash_ml_dsa_65_rsa3072_pkcs15 = _oid(id_CompSig + (85,))
+composite_sig04_hash_ml_dsa_65_rsa4096_pss = _oid(id_CompSig + (86,))
+composite_sig04_hash_ml_dsa_65_rsa4096_pkcs15 = _oid(id_CompSig + (87,))
+composite_sig04_hash_ml_dsa_65_ecdsa_p256 = _oid(id_CompSig + (88,))
+composite_sig04_hash_ml_dsa_65_ecdsa_p384 = _oid(id_CompSig + (89,))
+composite_sig04_hash_ml_dsa_65_ecdsa_brainpoolp256r1 = _oid(id_CompSig + (90,))
+composite_sig04_hash_ml_dsa_65_ed25519 = _oid(id_CompSig + (91,))
 
 # Hash-based ML-DSA 87 OIDs
-composite_sig04_hash_ml_dsa_87_ecdsa_p384 = univ.ObjectIdentifier(f"{id_CompSig}.92")
-composite_sig04_hash_ml_dsa_87_ecdsa_brainpoolp384r1 = univ.ObjectIdentifier(f"{id_CompSig}.93")
-composite_sig04_hash_ml_dsa_87_ed448 = univ.ObjectIdentifier(f"{id_CompSig}.94")
-composite_sig04_hash_ml_dsa_87_rsa4096_pss = univ.ObjectIdentifier(f"{id_CompSig}.95")
+composite_sig04_hash_ml_dsa_87_ecdsa_p384 = _oid(id_CompSig + (92,))
+composite_sig04_hash_ml_dsa_87_ecdsa_brainpoolp384r1 = _oid(id_CompSig + (93,))
+composite_sig04_hash_ml_dsa_87_ed448 = _oid(id_CompSig + (94,))
+composite_sig04_hash_ml_dsa_87_rsa4096_pss = _oid(id_CompSig + (95,))
 
 
 COMPOSITE_SIG04_HASH_NAME_TO_OID = {
@@ -316,47 +354,47 @@ COMP_SIG04_PREHASH_OID_2_HASH = {
 # Composite KEM
 ######################
 
-id_mlkem768_rsa2048 = univ.ObjectIdentifier(f"{id_CompKEM}.21")
-id_mlkem768_rsa3072 = univ.ObjectIdentifier(f"{id_CompKEM}.22")
-id_mlkem768_rsa4096 = univ.ObjectIdentifier(f"{id_CompKEM}.23")
-id_mlkem768_x25519 = univ.ObjectIdentifier(f"{id_CompKEM}.24")
-id_mlkem768_ecdh_p384 = univ.ObjectIdentifier(f"{id_CompKEM}.25")
-id_mlkem768_ecdh_brainpool_p256r1 = univ.ObjectIdentifier(f"{id_CompKEM}.26")
+id_mlkem768_rsa2048 = _oid(id_CompKEM + (21,))
+id_mlkem768_rsa3072 = _oid(id_CompKEM + (22,))
+id_mlkem768_rsa4096 = _oid(id_CompKEM + (23,))
+id_mlkem768_x25519 = _oid(id_CompKEM + (24,))
+id_mlkem768_ecdh_p384 = _oid(id_CompKEM + (25,))
+id_mlkem768_ecdh_brainpool_p256r1 = _oid(id_CompKEM + (26,))
 
-id_mlkem1024_ecdh_p384 = univ.ObjectIdentifier(f"{id_CompKEM}.27")
-id_mlkem1024_ecdh_brainpool_p384r1 = univ.ObjectIdentifier(f"{id_CompKEM}.28")
-id_mlkem1024_x448 = univ.ObjectIdentifier(f"{id_CompKEM}.29")
+id_mlkem1024_ecdh_p384 = _oid(id_CompKEM + (27,))
+id_mlkem1024_ecdh_brainpool_p384r1 = _oid(id_CompKEM + (28,))
+id_mlkem1024_x448 = _oid(id_CompKEM + (29,))
 
 
-id_composite_frodokem = f"{id_composite_kem_test_suite}.1"
-id_composite_mlkem_dhkemrfc9180 = f"{id_composite_kem_test_suite}.2"
-id_composite_frodokem_dhkemrfc9180 = f"{id_composite_kem_test_suite}.3"
+id_composite_frodokem = id_composite_kem_test_suite + (1,)
+id_composite_mlkem_dhkemrfc9180 = id_composite_kem_test_suite + (2,)
+id_composite_frodokem_dhkemrfc9180 = id_composite_kem_test_suite + (3,)
 
 
 # FrodoKEM-976-AES, FrodoKEM-976-SHAKE are Claimed NIST Level 3
 # So define eq to ML-KEM-768
-id_frodokem_976_aes_rsa2048 = univ.ObjectIdentifier(f"{id_composite_frodokem}.1")
-id_frodokem_976_aes_rsa3072 = univ.ObjectIdentifier(f"{id_composite_frodokem}.2")
-id_frodokem_976_aes_rsa4096 = univ.ObjectIdentifier(f"{id_composite_frodokem}.3")
-id_frodokem_976_aes_x25519 = univ.ObjectIdentifier(f"{id_composite_frodokem}.4")
-id_frodokem_976_aes_ecdh_p384 = univ.ObjectIdentifier(f"{id_composite_frodokem}.5")
-id_frodokem_976_aes_brainpoolP256r1 = univ.ObjectIdentifier(f"{id_composite_frodokem}.6")
-
-id_frodokem_976_shake_rsa2048 = univ.ObjectIdentifier(f"{id_composite_frodokem}.7")
-id_frodokem_976_shake_rsa3072 = univ.ObjectIdentifier(f"{id_composite_frodokem}.8")
-id_frodokem_976_shake_rsa4096 = univ.ObjectIdentifier(f"{id_composite_frodokem}.9")
-id_frodokem_976_shake_x25519 = univ.ObjectIdentifier(f"{id_composite_frodokem}.10")
-id_frodokem_976_shake_ecdh_p384 = univ.ObjectIdentifier(f"{id_composite_frodokem}.11")
-id_frodokem_976_shake_brainpoolP256r1 = univ.ObjectIdentifier(f"{id_composite_frodokem}.12")
+id_frodokem_976_aes_rsa2048 = _oid(id_composite_frodokem + (1,))
+id_frodokem_976_aes_rsa3072 = _oid(id_composite_frodokem + (2,))
+id_frodokem_976_aes_rsa4096 = _oid(id_composite_frodokem + (3,))
+id_frodokem_976_aes_x25519 = _oid(id_composite_frodokem + (4,))
+id_frodokem_976_aes_ecdh_p384 = _oid(id_composite_frodokem + (5,))
+id_frodokem_976_aes_brainpoolP256r1 = _oid(id_composite_frodokem + (6,))
+
+id_frodokem_976_shake_rsa2048 = _oid(id_composite_frodokem + (7,))
+id_frodokem_976_shake_rsa3072 = _oid(id_composite_frodokem + (8,))
+id_frodokem_976_shake_rsa4096 = _oid(id_composite_frodokem + (9,))
+id_frodokem_976_shake_x25519 = _oid(id_composite_frodokem + (10,))
+id_frodokem_976_shake_ecdh_p384 = _oid(id_composite_frodokem + (11,))
+id_frodokem_976_shake_brainpoolP256r1 = _oid(id_composite_frodokem + (12,))
 
 # FrodoKEM-1344-AES and FrodoKEM-1344-SHAKE are Claimed NIST Level 5.
 # So define eq to ML-KEM-1024
-id_frodokem_1344_aes_ecdh_p384 = univ.ObjectIdentifier(f"{id_composite_frodokem}.13")
-id_frodokem_1344_aes_ecdh_brainpoolP384r1 = univ.ObjectIdentifier(f"{id_composite_frodokem}.14")
-id_frodokem_1344_aes_x448 = univ.ObjectIdentifier(f"{id_composite_frodokem}.15")
-id_frodokem_1344_shake_ecdh_p384 = univ.ObjectIdentifier(f"{id_composite_frodokem}.16")
-id_frodokem_1344_shake_ecdh_brainpoolP384r1 = univ.ObjectIdentifier(f"{id_composite_frodokem}.17")
-id_frodokem_1344_shake_x448 = univ.ObjectIdentifier(f"{id_composite_frodokem}.18")
+id_frodokem_1344_aes_ecdh_p384 = _oid(id_composite_frodokem + (13,))
+id_frodokem_1344_aes_ecdh_brainpoolP384r1 = _oid(id_composite_frodokem + (14,))
+id_frodokem_1344_aes_x448 = _oid(id_composite_frodokem + (15,))
+id_frodokem_1344_shake_ecdh_p384 = _oid(id_composite_frodokem + (16,))
+id_frodokem_1344_shake_ecdh_brainpoolP384r1 = _oid(id_composite_frodokem + (17,))
+id_frodokem_1344_shake_x448 = _oid(id_composite_frodokem + (18,))
 
 
 MLKEM_OID_2_KDF_MAPPING = {
@@ -397,16 +435,16 @@ FRODOKEM_OID_2_KDF_MAPPING = {
 # Composite KEM v06
 
 # Composite KEM v06 OIDs
-id_comp_kem06_mlkem768_rsa2048 = univ.ObjectIdentifier(f"{id_CompKEM}.30")
-id_comp_kem06_mlkem768_rsa3072 = univ.ObjectIdentifier(f"{id_CompKEM}.31")
-id_comp_kem06_mlkem768_rsa4096 = univ.ObjectIdentifier(f"{id_CompKEM}.32")
-id_comp_kem06_mlkem768_x25519 = univ.ObjectIdentifier(f"{id_CompKEM}.33")
-id_comp_kem06_mlkem768_ecdh_p256 = univ.ObjectIdentifier(f"{id_CompKEM}.34")
-id_comp_kem06_mlkem768_ecdh_p384 = univ.ObjectIdentifier(f"{id_CompKEM}.35")
-id_comp_kem06_mlkem768_ecdh_brainpool_p256r1 = univ.ObjectIdentifier(f"{id_CompKEM}.36")
-id_comp_kem06_mlkem1024_ecdh_p384 = univ.ObjectIdentifier(f"{id_CompKEM}.37")
-id_comp_kem06_mlkem1024_ecdh_brainpool_p384r1 = univ.ObjectIdentifier(f"{id_CompKEM}.38")
-id_comp_kem06_mlkem1024_x448 = univ.ObjectIdentifier(f"{id_CompKEM}.39")
+id_comp_kem06_mlkem768_rsa2048 = _oid(id_CompKEM + (30,))
+id_comp_kem06_mlkem768_rsa3072 = _oid(id_CompKEM + (31,))
+id_comp_kem06_mlkem768_rsa4096 = _oid(id_CompKEM + (32,))
+id_comp_kem06_mlkem768_x25519 = _oid(id_CompKEM + (33,))
+id_comp_kem06_mlkem768_ecdh_p256 = _oid(id_CompKEM + (34,))
+id_comp_kem06_mlkem768_ecdh_p384 = _oid(id_CompKEM + (35,))
+id_comp_kem06_mlkem768_ecdh_brainpool_p256r1 = _oid(id_CompKEM + (36,))
+id_comp_kem06_mlkem1024_ecdh_p384 = _oid(id_CompKEM + (37,))
+id_comp_kem06_mlkem1024_ecdh_brainpool_p384r1 = _oid(id_CompKEM + (38,))
+id_comp_kem06_mlkem1024_x448 = _oid(id_CompKEM + (39,))
 
 COMPOSITE_KEM06_MLKEM_NAME_2_OID = {
     "composite-kem-ml-kem-768-rsa2048": id_comp_kem06_mlkem768_rsa2048,
@@ -426,34 +464,26 @@ COMPOSITE_KEM06_MLKEM_NAME_2_OID = {
 # Alternative DHKEM RFC9180 OIDs
 ##################################
 
-id_composite_mlkem768_dhkemrfc9180_X25519 = univ.ObjectIdentifier(f"{id_composite_mlkem_dhkemrfc9180}.1")
-id_composite_mlkem768_dhkemrfc9180_P384 = univ.ObjectIdentifier(f"{id_composite_mlkem_dhkemrfc9180}.2")
-id_composite_mlkem768_dhkemrfc9180_brainpoolP256r1 = univ.ObjectIdentifier(f"{id_composite_mlkem_dhkemrfc9180}.3")
-id_composite_mlkem1024_dhkemrfc9180_P384 = univ.ObjectIdentifier(f"{id_composite_mlkem_dhkemrfc9180}.4")
-id_composite_mlkem1024_dhkemrfc9180_brainpoolP384r1 = univ.ObjectIdentifier(f"{id_composite_mlkem_dhkemrfc9180}.5")
-id_composite_mlkem1024_dhkemrfc9180_X448 = univ.ObjectIdentifier(f"{id_composite_mlkem_dhkemrfc9180}.6")
-
-id_composite_frodokem_976_aes_dhkemrfc9180_X25519 = univ.ObjectIdentifier(f"{id_composite_frodokem_dhkemrfc9180}.1")
-id_composite_frodokem_976_aes_dhkemrfc9180_P384 = univ.ObjectIdentifier(f"{id_composite_frodokem_dhkemrfc9180}.2")
-id_composite_frodokem_976_aes_dhkemrfc9180_brainpoolP256r1 = univ.ObjectIdentifier(
-    f"{id_composite_frodokem_dhkemrfc9180}.3"
-)
-id_composite_frodokem_976_shake_dhkemrfc9180_X25519 = univ.ObjectIdentifier(f"{id_composite_frodokem_dhkemrfc9180}.4")
-id_composite_frodokem_976_shake_dhkemrfc9180_P384 = univ.ObjectIdentifier(f"{id_composite_frodokem_dhkemrfc9180}.5")
-id_composite_frodokem_976_shake_dhkemrfc9180_brainpoolP256r1 = univ.ObjectIdentifier(
-    f"{id_composite_frodokem_dhkemrfc9180}.6"
-)
-
-id_composite_frodokem_1344_aes_dhkemrfc9180_P384 = univ.ObjectIdentifier(f"{id_composite_frodokem_dhkemrfc9180}.7")
-id_composite_frodokem_1344_aes_dhkemrfc9180_brainpoolP384r1 = univ.ObjectIdentifier(
-    f"{id_composite_frodokem_dhkemrfc9180}.8"
-)
-id_composite_frodokem_1344_aes_dhkemrfc9180_X448 = univ.ObjectIdentifier(f"{id_composite_frodokem_dhkemrfc9180}.9")
-id_composite_frodokem_1344_shake_dhkemrfc9180_P384 = univ.ObjectIdentifier(f"{id_composite_frodokem_dhkemrfc9180}.10")
-id_composite_frodokem_1344_shake_dhkemrfc9180_brainpoolP384r1 = univ.ObjectIdentifier(
-    f"{id_composite_frodokem_dhkemrfc9180}.11"
-)
-id_composite_frodokem_1344_shake_dhkemrfc9180_X448 = univ.ObjectIdentifier(f"{id_composite_frodokem_dhkemrfc9180}.12")
+id_composite_mlkem768_dhkemrfc9180_X25519 = _oid(id_composite_mlkem_dhkemrfc9180 + (1,))
+id_composite_mlkem768_dhkemrfc9180_P384 = _oid(id_composite_mlkem_dhkemrfc9180 + (2,))
+id_composite_mlkem768_dhkemrfc9180_brainpoolP256r1 = _oid(id_composite_mlkem_dhkemrfc9180 + (3,))
+id_composite_mlkem1024_dhkemrfc9180_P384 = _oid(id_composite_mlkem_dhkemrfc9180 + (4,))
+id_composite_mlkem1024_dhkemrfc9180_brainpoolP384r1 = _oid(id_composite_mlkem_dhkemrfc9180 + (5,))
+id_composite_mlkem1024_dhkemrfc9180_X448 = _oid(id_composite_mlkem_dhkemrfc9180 + (6,))
+
+id_composite_frodokem_976_aes_dhkemrfc9180_X25519 = _oid(id_composite_frodokem_dhkemrfc9180 + (1,))
+id_composite_frodokem_976_aes_dhkemrfc9180_P384 = _oid(id_composite_frodokem_dhkemrfc9180 + (2,))
+id_composite_frodokem_976_aes_dhkemrfc9180_brainpoolP256r1 = _oid(id_composite_frodokem_dhkemrfc9180 + (3,))
+id_composite_frodokem_976_shake_dhkemrfc9180_X25519 = _oid(id_composite_frodokem_dhkemrfc9180 + (4,))
+id_composite_frodokem_976_shake_dhkemrfc9180_P384 = _oid(id_composite_frodokem_dhkemrfc9180 + (5,))
+id_composite_frodokem_976_shake_dhkemrfc9180_brainpoolP256r1 = _oid(id_composite_frodokem_dhkemrfc9180 + (6,))
+
+id_composite_frodokem_1344_aes_dhkemrfc9180_P384 = _oid(id_composite_frodokem_dhkemrfc9180 + (7,))
+id_composite_frodokem_1344_aes_dhkemrfc9180_brainpoolP384r1 = _oid(id_composite_frodokem_dhkemrfc9180 + (8,))
+id_composite_frodokem_1344_aes_dhkemrfc9180_X448 = _oid(id_composite_frodokem_dhkemrfc9180 + (9,))
+id_composite_frodokem_1344_shake_dhkemrfc9180_P384 = _oid(id_composite_frodokem_dhkemrfc9180 + (10,))
+id_composite_frodokem_1344_shake_dhkemrfc9180_brainpoolP384r1 = _oid(id_composite_frodokem_dhkemrfc9180 + (11,))
+id_composite_frodokem_1344_shake_dhkemrfc9180_X448 = _oid(id_composite_frodokem_dhkemrfc9180 + (12,))
 
 COMPOSITE_KEM_DHKEMRFC9180_NAME_2_OID = {
     "composite-dhkem-ml-kem-768-x25519": id_composite_mlkem768_dhkemrfc9180_X25519,
@@ -479,105 +509,130 @@ COMPOSITE_KEM_DHKEMRFC9180_NAME_2_OID = {
     "composite-dhkem-frodokem-1344-shake-x448": id_composite_frodokem_1344_shake_dhkemrfc9180_X448,
 }
 
-id_ce_deltaCertificateDescriptor = univ.ObjectIdentifier("2.16.840.1.114027.80.6.1")
-id_at_deltaCertificateRequestSignature = univ.ObjectIdentifier("2.16.840.1.114027.80.6.3")
-id_at_deltaCertificateRequest = univ.ObjectIdentifier("2.16.840.1.114027.80.6.2")
-
-
-id_chempat_x25519_sntrup761 = univ.ObjectIdentifier(f"{id_Chempat}.1")
-id_chempat_x25519_mceliece348864 = univ.ObjectIdentifier(f"{id_Chempat}.2")
-id_chempat_x25519_mceliece460896 = univ.ObjectIdentifier(f"{id_Chempat}.3")
-id_chempat_x25519_mceliece6688128 = univ.ObjectIdentifier(f"{id_Chempat}.4")
-id_chempat_x25519_mceliece6960119 = univ.ObjectIdentifier(f"{id_Chempat}.5")
-id_chempat_x25519_mceliece8192128 = univ.ObjectIdentifier(f"{id_Chempat}.6")
-id_chempat_x448_mceliece348864 = univ.ObjectIdentifier(f"{id_Chempat}.7")
-id_chempat_x448_mceliece460896 = univ.ObjectIdentifier(f"{id_Chempat}.8")
-id_chempat_x448_mceliece6688128 = univ.ObjectIdentifier(f"{id_Chempat}.9")
-id_chempat_x448_mceliece6960119 = univ.ObjectIdentifier(f"{id_Chempat}.10")
-id_chempat_x448_mceliece8192128 = univ.ObjectIdentifier(f"{id_Chempat}.11")
-id_chempat_x25519_ml_kem_768 = univ.ObjectIdentifier(f"{id_Chempat}.12")
-id_chempat_x448_ml_kem_1024 = univ.ObjectIdentifier(f"{id_Chempat}.13")
-id_chempat_p256_ml_kem_768 = univ.ObjectIdentifier(f"{id_Chempat}.14")
-id_Chempat_P384_ML_KEM_1024 = univ.ObjectIdentifier(f"{id_Chempat}.15")
-id_chempat_brainpool_p256_ml_kem_768 = univ.ObjectIdentifier(f"{id_Chempat}.16")
-id_chempat_brainpool_p384_ml_kem_1024 = univ.ObjectIdentifier(f"{id_Chempat}.17")
-
-# newly added in version 03, just specifies FrodoKEM and not aes or shake.
-id_chempat_x25519_frodokem_aes_976 = univ.ObjectIdentifier(f"{id_Chempat}.18")
-id_chempat_x25519_frodokem_shake_976 = univ.ObjectIdentifier(f"{id_Chempat}.19")
-id_chempat_brainpoolP256_frodokem_aes_640 = univ.ObjectIdentifier(f"{id_Chempat}.20")
-id_chempat_brainpoolP256_frodokem_shake_640 = univ.ObjectIdentifier(f"{id_Chempat}.21")
-id_chempat_brainpoolP384_frodokem_aes_976 = univ.ObjectIdentifier(f"{id_Chempat}.22")
-id_chempat_brainpoolP384_frodokem_shake_976 = univ.ObjectIdentifier(f"{id_Chempat}.23")
-id_chempat_brainpoolP512_frodokem_aes_1344 = univ.ObjectIdentifier(f"{id_Chempat}.24")
-id_chempat_brainpoolP512_frodokem_shake_1344 = univ.ObjectIdentifier(f"{id_Chempat}.25")
-
-# not inside the draft, but added for completeness.
-id_chempat_x448_frodokem_aes_1344 = univ.ObjectIdentifier(f"{id_Chempat}.26")
-id_chempat_x448_frodokem_shake_1344 = univ.ObjectIdentifier(f"{id_Chempat}.27")
+id_delta_cert: Final = (2, 16, 840, 1, 114027, 80, 6)
+
+id_ce_deltaCertificateDescriptor = _oid(id_delta_cert + (1,))
+id_at_deltaCertificateRequestSignature = _oid(id_delta_cert + (3,))
+id_at_deltaCertificateRequest = _oid(id_delta_cert + (2,))
+
+
+# The Chempat algorithm names, ordered by the last arc of their OID (`id_Chempat.1` to `id_Chempat.27`),
+# so that the OID and name tables are built from a single source.
+_CHEMPAT_NAMES = (
+    "chempat-sntrup761-x25519",  # 1
+    "chempat-mceliece-348864-x25519",  # 2
+    "chempat-mceliece-460896-x25519",  # 3
+    "chempat-mceliece-6688128-x25519",  # 4
+    "chempat-mceliece-6960119-x25519",  # 5
+    "chempat-mceliece-8192128-x25519",  # 6
+    "chempat-mceliece-348864-x448",  # 7
+    "chempat-mceliece-460896-x448",  # 8
+    "chempat-mceliece-6688128-x448",  # 9
+    "chempat-mceliece-6960119-x448",  # 10
+    "chempat-mceliece-8192128-x448",  # 11
+    "chempat-ml-kem-768-x25519",  # 12
+    "chempat-ml-kem-1024-x448",  # 13
+    "chempat-ml-kem-768-ecdh-secp256r1",  # 14
+    "chempat-ml-kem-1024-ecdh-secp384r1",  # 15
+    "chempat-ml-kem-768-ecdh-brainpoolP256r1",  # 16
+    "chempat-ml-kem-1024-ecdh-brainpoolP384r1",  # 17
+    # newly added in version 03, just specifies FrodoKEM and not aes or shake.
+    "chempat-frodokem-976-aes-x25519",  # 18
+    "chempat-frodokem-976-shake-x25519",  # 19
+    "chempat-frodokem-640-aes-ecdh-brainpoolP256r1",  # 20
+    "chempat-frodokem-640-shake-ecdh-brainpoolP256r1",  # 21
+    "chempat-frodokem-976-aes-ecdh-brainpoolP384r1",  # 22
+    "chempat-frodokem-976-shake-ecdh-brainpoolP384r1",  # 23
+    "chempat-frodokem-1344-aes-ecdh-brainpoolP512r1",  # 24
+    "chempat-frodokem-1344-shake-ecdh-brainpoolP512r1",  # 25
+    # not inside the draft, but added for completeness.
+    "chempat-frodokem-1344-aes-x448",  # 26
+    "chempat-frodokem-1344-shake-x448",  # 27
+)
 
 # TODO add eFrodoKEM.
 # id_chempat_x25519_efrodokem_aes_640
 
-CHEMPAT_OID_2_NAME = {
-    id_chempat_x25519_sntrup761: "chempat-sntrup761-x25519",
-    id_chempat_x25519_mceliece348864: "chempat-mceliece-348864-x25519",
-    id_chempat_x25519_mceliece460896: "chempat-mceliece-460896-x25519",
-    id_chempat_x25519_mceliece6688128: "chempat-mceliece-6688128-x25519",
-    id_chempat_x25519_mceliece6960119: "chempat-mceliece-6960119-x25519",
-    id_chempat_x25519_mceliece8192128: "chempat-mceliece-8192128-x25519",
-    id_chempat_x448_mceliece348864: "chempat-mceliece-348864-x448",
-    id_chempat_x448_mceliece460896: "chempat-mceliece-460896-x448",
-    id_chempat_x448_mceliece6688128: "chempat-mceliece-6688128-x448",
-    id_chempat_x448_mceliece6960119: "chempat-mceliece-6960119-x448",
-    id_chempat_x448_mceliece8192128: "chempat-mceliece-8192128-x448",
-    id_chempat_x25519_ml_kem_768: "chempat-ml-kem-768-x25519",
-    id_chempat_x448_ml_kem_1024: "chempat-ml-kem-1024-x448",
-    id_chempat_p256_ml_kem_768: "chempat-ml-kem-768-ecdh-secp256r1",
-    id_Chempat_P384_ML_KEM_1024: "chempat-ml-kem-1024-ecdh-secp384r1",
-    id_chempat_brainpool_p256_ml_kem_768: "chempat-ml-kem-768-ecdh-brainpoolP256r1",
-    id_chempat_brainpool_p384_ml_kem_1024: "chempat-ml-kem-1024-ecdh-brainpoolP384r1",
-    id_chempat_x25519_frodokem_aes_976: "chempat-frodokem-976-aes-x25519",
-    id_chempat_x25519_frodokem_shake_976: "chempat-frodokem-976-shake-x25519",
-    id_chempat_brainpoolP256_frodokem_aes_640: "chempat-frodokem-640-aes-ecdh-brainpoolP256r1",
-    id_chempat_brainpoolP256_frodokem_shake_640: "chempat-frodokem-640-shake-ecdh-brainpoolP256r1",
-    id_chempat_brainpoolP384_frodokem_aes_976: "chempat-frodokem-976-aes-ecdh-brainpoolP384r1",
-    id_chempat_brainpoolP384_frodokem_shake_976: "chempat-frodokem-976-shake-ecdh-brainpoolP384r1",
-    id_chempat_brainpoolP512_frodokem_aes_1344: "chempat-frodokem-1344-aes-ecdh-brainpoolP512r1",
-    id_chempat_brainpoolP512_frodokem_shake_1344: "chempat-frodokem-1344-shake-ecdh-brainpoolP512r1",
-    id_chempat_x448_frodokem_aes_1344: "chempat-frodokem-1344-aes-x448",
-    id_chempat_x448_frodokem_shake_1344: "chempat-frodokem-1344-shake-x448",
-}
-
+# Read-only, because the table is derived from `_CHEMPAT_NAMES` and merged into the
+# KEM tables in `resources.oidutils`.
+CHEMPAT_OID_2_NAME = MappingProxyType(
+    {_oid(id_Chempat + (arc,)): name for arc, name in enumerate(_CHEMPAT_NAMES, start=1)}
+)
 
 CHEMPAT_NAME_2_OID = {y: x for x, y in CHEMPAT_OID_2_NAME.items()}
 
+
+def get_chempat_name(oid: univ.ObjectIdentifier) -> Optional[str]:
+    """Return the Chempat algorithm name for the given OID.
+
+    All Chempat OIDs share the `id_Chempat` prefix and are numbered contiguously,
+    so the name is taken from `_CHEMPAT_NAMES` by the last arc, instead of hashing
+    the complete OID.
+
+    :param oid: The OID to look up.
+    :return: The Chempat algorithm name, or `None` if the OID is not a Chempat OID.
+    """
+    arcs = oid.asTuple()
+    if arcs[:-1] != id_Chempat or not 1 <= arcs[-1] <= len(_CHEMPAT_NAMES):
+        return None
+    return _CHEMPAT_NAMES[arcs[-1] - 1]
+
+
+id_chempat_x25519_sntrup761 = CHEMPAT_NAME_2_OID["chempat-sntrup761-x25519"]
+id_chempat_x25519_mceliece348864 = CHEMPAT_NAME_2_OID["chempat-mceliece-348864-x25519"]
+id_chempat_x25519_mceliece460896 = CHEMPAT_NAME_2_OID["chempat-mceliece-460896-x25519"]
+id_chempat_x25519_mceliece6688128 = CHEMPAT_NAME_2_OID["chempat-mceliece-6688128-x25519"]
+id_chempat_x25519_mceliece6960119 = CHEMPAT_NAME_2_OID["chempat-mceliece-6960119-x25519"]
+id_chempat_x25519_mceliece8192128 = CHEMPAT_NAME_2_OID["chempat-mceliece-8192128-x25519"]
+id_chempat_x448_mceliece348864 = CHEMPAT_NAME_2_OID["chempat-mceliece-348864-x448"]
+id_chempat_x448_mceliece460896 = CHEMPAT_NAME_2_OID["chempat-mceliece-460896-x448"]
+id_chempat_x448_mceliece6688128 = CHEMPAT_NAME_2_OID["chempat-mceliece-6688128-x448"]
+id_chempat_x448_mceliece6960119 = CHEMPAT_NAME_2_OID["chempat-mceliece-6960119-x448"]
+id_chempat_x448_mceliece8192128 = CHEMPAT_NAME_2_OID["chempat-mceliece-8192128-x448"]
+id_chempat_x25519_ml_kem_768 = CHEMPAT_NAME_2_OID["chempat-ml-kem-768-x25519"]
+id_chempat_x448_ml_kem_1024 = CHEMPAT_NAME_2_OID["chempat-ml-kem-1024-x448"]
+id_chempat_p256_ml_kem_768 = CHEMPAT_NAME_2_OID["chempat-ml-kem-768-ecdh-secp256r1"]
+id_Chempat_P384_ML_KEM_1024 = CHEMPAT_NAME_2_OID["chempat-ml-kem-1024-ecdh-secp384r1"]
+id_chempat_brainpool_p256_ml_kem_768 = CHEMPAT_NAME_2_OID["chempat-ml-kem-768-ecdh-brainpoolP256r1"]
+id_chempat_brainpool_p384_ml_kem_1024 = CHEMPAT_NAME_2_OID["chempat-ml-kem-1024-ecdh-brainpoolP384r1"]
+
+id_chempat_x25519_frodokem_aes_976 = CHEMPAT_NAME_2_OID["chempat-frodokem-976-aes-x25519"]
+id_chempat_x25519_frodokem_shake_976 = CHEMPAT_NAME_2_OID["chempat-frodokem-976-shake-x25519"]
+id_chempat_brainpoolP256_frodokem_aes_640 = CHEMPAT_NAME_2_OID["chempat-frodokem-640-aes-ecdh-brainpoolP256r1"]
+id_chempat_brainpoolP256_frodokem_shake_640 = CHEMPAT_NAME_2_OID["chempat-frodokem-640-shake-ecdh-brainpoolP256r1"]
+id_chempat_brainpoolP384_frodokem_aes_976 = CHEMPAT_NAME_2_OID["chempat-frodokem-976-aes-ecdh-brainpoolP384r1"]
+id_chempat_brainpoolP384_frodokem_shake_976 = CHEMPAT_NAME_2_OID["chempat-frodokem-976-shake-ecdh-brainpoolP384r1"]
+id_chempat_brainpoolP512_frodokem_aes_1344 = CHEMPAT_NAME_2_OID["chempat-frodokem-1344-aes-ecdh-brainpoolP512r1"]
+id_chempat_brainpoolP512_frodokem_shake_1344 = CHEMPAT_NAME_2_OID["chempat-frodokem-1344-shake-ecdh-brainpoolP512r1"]
+id_chempat_x448_frodokem_aes_1344 = CHEMPAT_NAME_2_OID["chempat-frodokem-1344-aes-x448"]
+id_chempat_x448_frodokem_shake_1344 = CHEMPAT_NAME_2_OID["chempat-frodokem-1344-shake-x448"]
+
 ########################
 # Hybrid Signature OIDs
 ########################
 
 
-id_relatedCert = univ.ObjectIdentifier(f"{id_hybrid_sig_multi_auth}.{1}")
-id_aa_relatedCertRequest = univ.ObjectIdentifier(f"{id_hybrid_sig_multi_auth}.{2}")
-id_mod_related_cert = univ.ObjectIdentifier(f"{id_hybrid_sig_multi_auth}.{3}")
+id_relatedCert = _oid(id_hybrid_sig_multi_auth.asTuple() + (1,))
+id_aa_relatedCertRequest = _oid(id_hybrid_sig_multi_auth.asTuple() + (2,))
+id_mod_related_cert = _oid(id_hybrid_sig_multi_auth.asTuple() + (3,))
 
 
-id_ad_certDiscovery = univ.ObjectIdentifier(f"{id_hybrid_sig_cert_binding}.{1}")
-id_ad_relatedCertificateDescriptor = univ.ObjectIdentifier(f"{id_hybrid_sig_cert_binding}.{2}")
+id_ad_certDiscovery = _oid(id_hybrid_sig_cert_binding.asTuple() + (1,))
+id_ad_relatedCertificateDescriptor = _oid(id_hybrid_sig_cert_binding.asTuple() + (2,))
 
 
 # Hybrid SUN Signature OIDs
 # CSR OIDs
 
-id_altSubPubKeyHashAlgAttr = univ.ObjectIdentifier(f"{id_hybrid_sun}.2")
-id_altSubPubKeyLocAttr = univ.ObjectIdentifier(f"{id_hybrid_sun}.3")
-id_altSigValueHashAlgAttr = univ.ObjectIdentifier(f"{id_hybrid_sun}.4")
-id_altSigValueLocAttr = univ.ObjectIdentifier(f"{id_hybrid_sun}.5")
+id_altSubPubKeyHashAlgAttr = _oid(id_hybrid_sun.asTuple() + (2,))
+id_altSubPubKeyLocAttr = _oid(id_hybrid_sun.asTuple() + (3,))
+id_altSigValueHashAlgAttr = _oid(id_hybrid_sun.asTuple() + (4,))
+id_altSigValueLocAttr = _oid(id_hybrid_sun.asTuple() + (5,))
 
 # x509 OIDs
 
-id_altSubPubKeyExt = univ.ObjectIdentifier(f"{id_hybrid_sun}.6")
-id_altSignatureExt = univ.ObjectIdentifier(f"{id_hybrid_sun}.7")
+id_altSubPubKeyExt = _oid(id_hybrid_sun.asTuple() + (6,))
+id_altSignatureExt = _oid(id_hybrid_sun.asTuple() + (7,))
 
 COMPOSITE_KEM05_MLKEM_NAME_2_OID = {
     "composite-kem-05-ml-kem-768-rsa2048": id_mlkem768_rsa2048,
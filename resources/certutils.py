@@ -184,14 +184,15 @@ def verify_cert_signature(cert: rfc9480.CMPCertificate, issuer_pub_key: Optional
     :param issuer_pub_key: Optional PublicKeySig used for verification.
     :raises InvalidSignature: If the certificate's signature is not valid.
     """
-    tbs_der = encoder.encode(cert["tbsCertificate"])
+    tbs_cert = cert["tbsCertificate"]
+    tbs_der = encoder.encode(tbs_cert)
     pub_key = issuer_pub_key or load_public_key_from_cert(cert)
     pub_key = ensure_is_verify_key(pub_key)
     protectionutils.verify_signature_with_alg_id(
         public_key=pub_key,
         data=tbs_der,
         signature=cert["signature"].asOctets(),
-        alg_id=cert["tbsCertificate"]["signature"],
+        alg_id=tbs_cert["signature"],
     )
 
 
@@ -2167,19 +2168,16 @@ def verify_csr_signature(  # noqa: D417 Missing argument descriptions in the doc
 
     """
     alg_id = csr["signatureAlgorithm"]
-    spki = csr["certificationRequestInfo"]["subjectPublicKeyInfo"]
+    cert_req_info = csr["certificationRequestInfo"]
+    public_key = keyutils.load_public_key_from_spki(cert_req_info["subjectPublicKeyInfo"])
 
     if alg_id["algorithm"] in CMS_COMPOSITE03_OID_2_NAME:
-        public_key = keyutils.load_public_key_from_spki(spki)
         CompositeSig03PublicKey.validate_oid(alg_id["algorithm"], public_key)
-    else:
-        public_key = keyutils.load_public_key_from_spki(spki)
 
     verify_key = ensure_is_verify_key(public_key)
 
     signature = csr["signature"].asOctets()
-    alg_id = csr["signatureAlgorithm"]
-    data = encoder.encode(csr["certificationRequestInfo"])
+    data = encoder.encode(cert_req_info)
     try:
         protectionutils.verify_signature_with_alg_id(
             public_key=verify_key, alg_id=alg_id, signature=signature, data=data
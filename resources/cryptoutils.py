@@ -16,7 +16,7 @@ and password-based key derivation (PBKDF2).
 import logging
 import math
 import os
-from typing import Optional, Tuple, Union
+from typing import Callable, Dict, Optional, Tuple, Union
 
 from Crypto.PublicKey import RSA
 from Crypto.Signature import pss
@@ -669,9 +669,7 @@ def verify_signature(  # noqa D417 undocumented-param
         public_key.verify(signature=signature, data=data, use_pss=use_rsa_pss, pre_hash=use_pre_hash)
 
     else:
-        if isinstance(hash_alg, hashes.HashAlgorithm):
-            pass
-        elif hash_alg is not None:
+        if isinstance(hash_alg, str):
             hash_alg = oid_mapping.hash_name_to_instance(hash_alg)
 
         _verify_trad_signature(
@@ -684,6 +682,116 @@ def verify_signature(  # noqa D417 undocumented-param
         )
 
 
+def _require_hash_alg(public_key: VerifyKey, hash_alg: Optional[hashes.HashAlgorithm]) -> hashes.HashAlgorithm:
+    """Return the hash algorithm or raise a `ValueError`, if the key type requires one and it is missing."""
+    if not hash_alg:
+        raise ValueError(f"The {type(public_key).__name__} requires a hash algorithm.")
+    return hash_alg
+
+
+def _verify_rsa_signature(
+    public_key: RSAPublicKey,
+    signature: bytes,
+    data: bytes,
+    hash_alg: Optional[hashes.HashAlgorithm],
+    use_rsa_pss: bool,
+    salt_length: Optional[int],
+) -> None:
+    """Verify an RSA signature with either PKCS#1 v1.5 or PSS padding."""
+    hash_alg = _require_hash_alg(public_key, hash_alg)
+    if use_rsa_pss:
+        public_key.verify(
+            signature,
+            data,
+            padding.PSS(mgf=padding.MGF1(hash_alg), salt_length=salt_length or hash_alg.digest_size),
+            hash_alg,  # type: ignore
+        )
+    else:
+        public_key.verify(signature, data, padding=padding.PKCS1v15(), algorithm=hash_alg)
+
+
+def _verify_ecdsa_signature(
+    public_key: ec.EllipticCurvePublicKey,
+    signature: bytes,
+    data: bytes,
+    hash_alg: Optional[hashes.HashAlgorithm],
+    use_rsa_pss: bool,
+    salt_length: Optional[int],
+) -> None:
+    """Verify an ECDSA signature."""
+    public_key.verify(signature, data, ec.ECDSA(_require_hash_alg(public_key, hash_alg)))
+
+
+def _verify_dsa_signature(
+    public_key: dsa.DSAPublicKey,
+    signature: bytes,
+    data: bytes,
+    hash_alg: Optional[hashes.HashAlgorithm],
+    use_rsa_pss: bool,
+    salt_length: Optional[int],
+) -> None:
+    """Verify a DSA signature."""
+    public_key.verify(signature, data, _require_hash_alg(public_key, hash_alg))
+
+
+def _verify_eddsa_signature(
+    public_key: Union[ed25519.Ed25519PublicKey, ed448.Ed448PublicKey],
+    signature: bytes,
+    data: bytes,
+    hash_alg: Optional[hashes.HashAlgorithm],
+    use_rsa_pss: bool,
+    salt_length: Optional[int],
+) -> None:
+    """Verify an Ed25519 or Ed448 signature, which does not use a separate hash algorithm."""
+    public_key.verify(signature, data)
+
+
+def _reject_kex_key(
+    public_key: Union[x25519.X25519PublicKey, x448.X448PublicKey],
+    signature: bytes,
+    data: bytes,
+    hash_alg: Optional[hashes.HashAlgorithm],
+    use_rsa_pss: bool,
+    salt_length: Optional[int],
+) -> None:
+    """Raise a `ValueError`, because key exchange keys cannot verify signatures."""
+    raise ValueError(
+        f"Key type '{type(public_key).__name__}' is not used for signing or verifying signatures."
+        f"It is used for key exchange."
+    )
+
+
+# The `cryptography` key classes are abstract base classes, so the concrete key types are resolved
+# with `isinstance` once and then cached by their type.
+_TRAD_VERIFIERS = (
+    ((ed25519.Ed25519PublicKey, ed448.Ed448PublicKey), _verify_eddsa_signature),
+    (rsa.RSAPublicKey, _verify_rsa_signature),
+    (ec.EllipticCurvePublicKey, _verify_ecdsa_signature),
+    (dsa.DSAPublicKey, _verify_dsa_signature),
+    ((x25519.X25519PublicKey, x448.X448PublicKey), _reject_kex_key),
+)
+_TRAD_VERIFIER_BY_TYPE: Dict[type, Callable[..., None]] = {}
+
+
+def _get_trad_verifier(public_key: VerifyKey) -> Callable[..., None]:
+    """Return the verification function for the type of the given traditional public key.
+
+    :param public_key: The public key to look up the verification function for.
+    :return: The verification function.
+    :raises BadAlg: If the key type is not supported.
+    """
+    key_type = type(public_key)
+    verifier = _TRAD_VERIFIER_BY_TYPE.get(key_type)
+    if verifier is None:
+        for key_classes, verifier in _TRAD_VERIFIERS:
+            if isinstance(public_key, key_classes):
+                _TRAD_VERIFIER_BY_TYPE[key_type] = verifier
+                break
+        else:
+            raise BadAlg(f"Unsupported key type to verify a signature: {key_type.__name__}.")
+    return verifier
+
+
 def _verify_trad_signature(
     public_key: Union[
         RSAPublicKey,
@@ -699,35 +807,8 @@ def _verify_trad_signature(
     salt_length: Optional[int] = None,
 ) -> None:
     """Verify a digital signature using a standalone public key."""
-    if isinstance(public_key, (ed25519.Ed25519PublicKey, ed448.Ed448PublicKey)):
-        public_key.verify(signature, data)
-        return
-
-    if not hash_alg:
-        raise ValueError(f"The {type(public_key).__name__} requires a hash algorithm.")
-
-    if isinstance(public_key, rsa.RSAPublicKey):
-        if use_rsa_pss:
-            public_key.verify(
-                signature,
-                data,
-                padding.PSS(mgf=padding.MGF1(hash_alg), salt_length=salt_length or hash_alg.digest_size),
-                hash_alg,  # type: ignore
-            )
-        else:
-            public_key.verify(signature, data, padding=padding.PKCS1v15(), algorithm=hash_alg)
-    elif isinstance(public_key, ec.EllipticCurvePublicKey):
-        public_key.verify(signature, data, ec.ECDSA(hash_alg))
-    elif isinstance(public_key, dsa.DSAPublicKey):
-        public_key.verify(signature, data, hash_alg)
-
-    elif isinstance(public_key, (x25519.X25519PublicKey, x448.X448PublicKey)):
-        raise ValueError(
-            f"Key type '{type(public_key).__name__}' is not used for signing or verifying signatures."
-            f"It is used for key exchange."
-        )
-    else:
-        raise BadAlg(f"Unsupported key type to verify a signature: {type(public_key).__name__}.")
+    verifier = _get_trad_verifier(public_key)
+    verifier(public_key, signature, data, hash_alg, use_rsa_pss, salt_length)
 
 
 @not_keyword
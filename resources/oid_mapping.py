@@ -10,6 +10,7 @@ algorithms, create cryptographic instances, and perform lookups between human-re
 corresponding OIDs.
 """
 
+import functools
 import logging
 from typing import Optional, Union
 
@@ -160,9 +161,12 @@ def get_hash_from_oid(oid: univ.ObjectIdentifier, only_hash: bool = False) -> Un
 
 
 @not_keyword
+@functools.lru_cache(maxsize=None)
 def hash_name_to_instance(alg: str) -> hashes.HashAlgorithm:
     """Return an instance of a hash algorithm object based on its name.
 
+    The instances are stateless, so the cached objects are shared between all callers.
+
     :param alg: The name of hashing algorithm, e.g., 'sha256'
     :return: `cryptography.hazmat.primitives.hashes`
     :raises ValueError: If the specified hash algorithm is not supported.
@@ -8,7 +8,6 @@ import base64
 import logging
 import os
 import re
-import textwrap
 from base64 import b64decode, b64encode
 from collections import Counter
 from itertools import combinations
@@ -36,6 +35,9 @@ from resources.oidutils import (
 )
 from resources.typingutils import PrivateKey, PublicKey, Strint
 
+# Matches the PEM armour lines, like -----BEGIN CERTIFICATE----- or -----END CERTIFICATE-----.
+_PEM_ARMOUR_PATTERN = re.compile("-----(?:BEGIN|END) .*?-----")
+
 
 def nonces_must_be_diverse(nonces: List[bytes], minimal_hamming_distance: Strint = 10):
     """Check that a list of nonces are diverse enough, by computing the Hamming distance between them.
@@ -49,15 +51,21 @@ def nonces_must_be_diverse(nonces: List[bytes], minimal_hamming_distance: Strint
               the first violation it finds.
     """
     minimal_hamming_distance = int(minimal_hamming_distance)
+    if not nonces:
+        return
 
-    for nonce1, nonce2 in combinations(nonces, 2):
-        # Pad the shorter nonce with zeros, so they are of the same length
-        max_length = max(len(nonce1), len(nonce2))
-        nonce1 = nonce1.ljust(max_length, b"\x00")
-        nonce2 = nonce2.ljust(max_length, b"\x00")
+    # Pad all nonces once to the longest length and convert them to integers, so the Hamming distance of a pair is
+    # a single XOR and popcount. Extra zero padding does not change the distance.
+    length = max(len(nonce) for nonce in nonces)
+    values = [int.from_bytes(nonce.ljust(length, b"\x00"), "big") for nonce in nonces]
 
-        hamming_distance = sum(bin(n1 ^ n2).count("1") for n1, n2 in zip(nonce1, nonce2))
+    for (nonce1, value1), (nonce2, value2) in combinations(zip(nonces, values), 2):
+        hamming_distance = (value1 ^ value2).bit_count()
         if hamming_distance < minimal_hamming_distance:
+            # Pad the shorter nonce with zeros, so they are of the same length
+            max_length = max(len(nonce1), len(nonce2))
+            nonce1 = nonce1.ljust(max_length, b"\x00")
+            nonce2 = nonce2.ljust(max_length, b"\x00")
             report = (
                 f"Nonces are not diverse enough! Hamming distance between nonces {nonce1!r} and {nonce2!r} is "
                 f"{hamming_distance}, but should have been at least {minimal_hamming_distance}."
@@ -78,6 +86,10 @@ def nonces_must_be_unique(nonces: List[bytes]):
     """
     # uncomment this to provoke an error by duplicating a nonce
     # nonces.append(nonces[0])
+    if len(set(nonces)) == len(nonces):
+        return
+
+    # only count the nonces for the report, once a duplicate is known to exist.
     nonce_counts = Counter(nonces)
     repeated_nonces = [(nonce, count) for nonce, count in nonce_counts.items() if count > 1]
 
@@ -91,6 +103,10 @@ def log_asn1(pyasn1_obj: base.Asn1Type):
     For convenience, it will gracefully ignore objects that are not pyasn1, so that the function can be invoked from
     RobotFramework scenarios without having to check the type of the object first.
     """
+    # `prettyPrint` walks the whole structure, so skip it if the message would be discarded anyway.
+    if not logging.getLogger().isEnabledFor(logging.INFO):
+        return
+
     if isinstance(pyasn1_obj, base.Asn1Type):
         logging.info(pyasn1_obj.prettyPrint())
     else:
@@ -99,6 +115,9 @@ def log_asn1(pyasn1_obj: base.Asn1Type):
 
 def log_base64(data: Union[bytes, str]):
     """Log some data as a base64 encoded string, this is useful for binary payloads."""
+    if not logging.getLogger().isEnabledFor(logging.INFO):
+        return
+
     if isinstance(data, bytes):
         logging.info(b64encode(data))
     elif isinstance(data, str):
@@ -113,9 +132,11 @@ def manipulate_first_byte(data: bytes) -> bytes:
     :param data: bytes, buffer to modify
     :returns: bytes, modified buffer
     """
+    # slicing a memoryview does not copy, so the buffer is only copied once by the concatenation.
+    rest = memoryview(data)[1:]
     if data[0] == 0:
-        return b"\x01" + data[1:]
-    return b"\x00" + data[1:]
+        return b"\x01" + rest
+    return b"\x00" + rest
 
 
 def buffer_length_must_be_at_least(data: bytes, length: Strint) -> None:
@@ -129,6 +150,24 @@ def buffer_length_must_be_at_least(data: bytes, length: Strint) -> None:
         raise ValueError(f"Buffer length {len(data)} < {length}, but should have been >={length} bytes!")
 
 
+def _pem_lines_to_der(lines: Iterable[str]) -> bytes:
+    """Decode the base64 body of PEM lines in a single pass.
+
+    Comments (lines starting with #), blank lines and the armour lines starting with `-----` are skipped,
+    so the data may be given with or without a header and trailer.
+
+    :param lines: The lines of the PEM data.
+    :return: The decoded DER-encoded bytes.
+    """
+    body = []
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#") or line.startswith("-----"):
+            continue
+        body.append(line)
+    return b64decode("".join(body))
+
+
 @keyword(name="Decode PEM String")
 def decode_pem_string(data: Union[bytes, str]) -> bytes:
     """Decode a PEM-encoded string or byte sequence to its raw DER-encoded bytes.
@@ -139,25 +178,7 @@ def decode_pem_string(data: Union[bytes, str]) -> bytes:
     if isinstance(data, bytes):
         data = data.decode("ascii")
 
-    raw = data.splitlines()
-    filtered_lines = []
-    # first do some cosmetic filtering
-    for line in raw:
-        if line.startswith("#"):  # remove comments
-            continue
-        if line.strip() == "":  # remove blank lines
-            continue
-
-        filtered_lines.append(line)
-
-    if "-----BEGIN" in filtered_lines[0]:
-        result = "".join(filtered_lines[1:-1])
-    else:
-        result = "".join(filtered_lines)
-
-    # note that b64decode doesn't care about \n in the string to be decoded, so we keep them to potentially improve
-    # readability when debugging.
-    return b64decode(result)
+    return _pem_lines_to_der(data.splitlines())
 
 
 @keyword("Load And Decode PEM File")
@@ -171,27 +192,8 @@ def load_and_decode_pem_file(path: str) -> bytes:
     :returns: bytes, the data loaded from the file.
     """
     # normally it should always have a header/trailer (aka "armour"), but we'll be tolerant to that.
-
-    filtered_lines = []
     with open(path, "r", encoding="ascii") as f:
-        raw = f.readlines()
-        # first do some cosmetic filtering
-        for line in raw:
-            if line.startswith("#"):  # remove comments
-                continue
-            if line.strip() == "":  # remove blank lines
-                continue
-
-            filtered_lines.append(line)
-
-    if "-----BEGIN" in filtered_lines[0]:
-        result = "".join(filtered_lines[1:-1])
-    else:
-        result = "".join(filtered_lines)
-
-    # note that b64decode doesn't care about \n in the string to be decoded, so we keep them to potentially improve
-    # readability when debugging.
-    return b64decode(result)
+        return _pem_lines_to_der(f)
 
 
 def strip_armour(raw: bytes) -> bytes:
@@ -201,8 +203,7 @@ def strip_armour(raw: bytes) -> bytes:
     :returns: bytes unarmoured data
     """
     result = raw.decode("ascii")
-    result = re.sub("-----BEGIN .*?-----", "", result)
-    result = re.sub("-----END .*?-----", "", result)
+    result = _PEM_ARMOUR_PATTERN.sub("", result)
     result = result.replace("\n", "")
     return bytes(result, "ascii")
 
@@ -229,16 +230,7 @@ def pem_to_der(pem_data: Union[str, bytes]) -> bytes:
     if isinstance(pem_data, bytes):
         pem_data = pem_data.decode("utf-8")
 
-    # Split the PEM string into lines
-    lines = pem_data.strip().splitlines()
-
-    # Filter out the header and footer lines
-    pem_body = "".join(line for line in lines if not line.startswith("-----"))
-
-    # Decode the base64 encoded content to DER format
-    der_data = base64.b64decode(pem_body)
-
-    return der_data
+    return _pem_lines_to_der(pem_data.splitlines())
 
 
 @not_keyword
@@ -285,14 +277,16 @@ def log_certificates(  # noqa D417 undocumented-param
     | Log Certificates | ${cert_list} | msg_suffix="Certificate Details: " |
 
     """
+    if not logging.getLogger().isEnabledFor(logging.INFO):
+        return
+
     if msg_suffix is None:
         msg_suffix = "%s"
     else:
         msg_suffix += "%s"
 
-    asn1certs = univ.SequenceOf()
-    asn1certs.extend(certs)
-    logging.info(msg_suffix, asn1certs.prettyPrint())
+    # print the certificates directly, wrapping them in a `SequenceOf` only adds a copy of each certificate.
+    logging.info(msg_suffix, "\n".join(cert.prettyPrint() for cert in certs))
 
 
 def write_certs_to_dir(  # noqa D417 undocumented-param
@@ -332,6 +326,16 @@ def write_certs_to_dir(  # noqa D417 undocumented-param
         write_cmp_certificate_to_pem(path=tmp_path, cert=cert)
 
 
+def _base64_pem_body(der_data: bytes) -> str:
+    """Base64-encode DER data and split it into the 64-character lines of a PEM body.
+
+    :param der_data: The DER-encoded data.
+    :return: The base64 lines joined with newlines.
+    """
+    b64_encoded = base64.b64encode(der_data).decode("ascii")
+    return "\n".join(b64_encoded[i : i + 64] for i in range(0, len(b64_encoded), 64))
+
+
 @not_keyword
 def pyasn1_cert_to_pem(cert: rfc9480.CMPCertificate) -> str:
     """Convert a `pyasn1` rfc9480.CMPCertificate into a PEM string.
@@ -339,9 +343,7 @@ def pyasn1_cert_to_pem(cert: rfc9480.CMPCertificate) -> str:
     :param cert: The certificate to decode/convert.
     :return: The PEM string.
     """
-    der_cert = encoder.encode(cert)
-    b64_encoded = base64.b64encode(der_cert).decode("utf-8")
-    b64_encoded = "\n".join(textwrap.wrap(b64_encoded, width=64))
+    b64_encoded = _base64_pem_body(encoder.encode(cert))
     pem_cert = "-----BEGIN CERTIFICATE-----\n" + b64_encoded + "\n-----END CERTIFICATE-----\n"
     return pem_cert
 
@@ -353,9 +355,7 @@ def pyasn1_csr_to_pem(csr: rfc6402.CertificationRequest) -> bytes:
     :param csr: The certificate to decode/convert.
     :return: The PEM string as bytes.
     """
-    der_cert = encoder.encode(csr)
-    b64_encoded = base64.b64encode(der_cert).decode("utf-8")
-    b64_encoded = "\n".join(textwrap.wrap(b64_encoded, width=64))
+    b64_encoded = _base64_pem_body(encoder.encode(csr))
     pem_cert = "-----BEGIN CERTIFICATE REQUEST-----\n" + b64_encoded + "\n-----END CERTIFICATE REQUEST-----\n"
     return pem_cert.encode("utf-8")
 
@@ -367,8 +367,9 @@ def write_cmp_certificate_to_pem(cert: rfc9480.CMPCertificate, path: str) -> Non
     :param path: Path to the file where the PEM certificate will be written
     :return:
     """
-    with open(path, "w", encoding="utf-8") as pem_file:
-        pem_file.write(pyasn1_cert_to_pem(cert))
+    # PEM is plain ASCII, so write the bytes directly without the text layer.
+    with open(path, "wb") as pem_file:
+        pem_file.write(pyasn1_cert_to_pem(cert).encode("ascii"))
 
 
 def load_certificate_chain(filepath: str) -> List[rfc9480.CMPCertificate]:
@@ -380,7 +381,6 @@ def load_certificate_chain(filepath: str) -> List[rfc9480.CMPCertificate]:
     certificates = []
     certificate = []
     inside_certificate = False
-    pem_certificates = []
 
     with open(filepath, "r", encoding="utf-8") as file:
         for line in file:
@@ -393,15 +393,13 @@ def load_certificate_chain(filepath: str) -> List[rfc9480.CMPCertificate]:
                 certificate = []
             elif "-----END CERTIFICATE-----" in line:
                 inside_certificate = False
-                pem_certificates.append("".join(certificate))
+                # decode as soon as the certificate is complete, the body is joined only once.
+                der_bytes = b64decode("".join(certificate))
+                cert, _ = decoder.decode(der_bytes, asn1Spec=rfc9480.CMPCertificate())
+                certificates.append(cert)
             elif inside_certificate:
                 certificate.append(line)
 
-    for pem_cert in pem_certificates:
-        der_bytes = b64decode("".join(pem_cert))
-        cert, _ = decoder.decode(der_bytes, asn1Spec=rfc9480.CMPCertificate())
-        certificates.append(cert)
-
     return certificates
 
 
@@ -420,38 +418,33 @@ def get_openssl_name_notation(
     :return: A name in OpenSSL notation, e.g., "C=DE,ST=Bavaria,L= Munich,CN=Joe Mustermann" or a dict or
     None if the oids where not inside.
     """
-    out_name = None
+    parts = []
     dict_data = {}
 
     if oids is None:
         oids = PYASN1_CM_OID_2_NAME.keys()
+    else:
+        oids = frozenset(oids)
 
     for rdn in name["rdnSequence"]:
         attribute: rfc2986.AttributeTypeAndValue
         for attribute in rdn:
-            if attribute["type"] in oids:
-                # need to remove asn1 type value.
-                dict_data[PYASN1_CM_OID_2_NAME.get(attribute["type"])] = (
-                    decoder.decode(attribute["value"])[0]
-                ).prettyPrint()
-                if out_name is None:
-                    out_name = (
-                        f"{PYASN1_CM_OID_2_NAME.get(attribute['type'])}="
-                        + (decoder.decode(attribute["value"])[0]).prettyPrint()
-                    )
-                else:
-                    out_name += (
-                        f",{PYASN1_CM_OID_2_NAME.get(attribute['type'])}="
-                        + (decoder.decode(attribute["value"])[0]).prettyPrint()
-                    )
+            oid = attribute["type"]
+            if oid not in oids:
+                continue
+            key = PYASN1_CM_OID_2_NAME.get(oid)
+            # need to remove asn1 type value, decoded only once per attribute.
+            value = decoder.decode(attribute["value"])[0].prettyPrint()
+            dict_data[key] = value
+            parts.append(f"{key}={value}")
 
     if return_dict:
         return dict_data  # type: ignore
 
-    if out_name is None:
+    if not parts:
         return "NULL-DN"
 
-    return out_name
+    return ",".join(parts)
 
 
 @not_keyword
@@ -697,8 +690,10 @@ def check_if_private_key_in_list(  # noqa D417 undocumented-param
     | ${is_duplicate}= | Check If Private Key In List | keys=${existing_keys} | new_key=${another_private_key} |
 
     """
+    # deriving a public key can be expensive (e.g., for PQ keys), so it is only done once for the new key.
+    new_public_key = new_key.public_key()
     for key in keys:
-        if not check_public_key_is_not_unique(key.public_key(), new_key.public_key(), strict=True):
+        if not check_public_key_is_not_unique(key.public_key(), new_public_key, strict=True):
             return True
 
     return False
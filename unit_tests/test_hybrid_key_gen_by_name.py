@@ -5,7 +5,7 @@
 import unittest
 from pq_logic.tmp_oids import COMPOSITE_SIG04_NAME_2_OID, COMPOSITE_SIG03_NAME_2_OID, COMPOSITE_KEM05_NAME_2_OID, \
     CHEMPAT_NAME_2_OID, CHEMPAT_OID_2_NAME, COMPOSITE_KEM05_OID_2_NAME, COMPOSITE_SIG03_OID_2_NAME, \
-    COMPOSITE_SIG04_OID_2_NAME, COMPOSITE_KEM06_NAME_2_OID, COMPOSITE_KEM06_OID_2_NAME
+    COMPOSITE_SIG04_OID_2_NAME, COMPOSITE_KEM06_NAME_2_OID, COMPOSITE_KEM06_OID_2_NAME, get_chempat_name
 from resources.keyutils import generate_key, get_key_name
 from resources.oid_mapping import may_return_oid_to_name
 from resources.oidutils import PQ_SIG_PRE_HASH_NAME_2_OID
@@ -77,6 +77,18 @@ class TestCompositeSig04(unittest.TestCase):
             err_msg = f"Expected: {name} Got: {may_return_oid_to_name(_oid)}"
             self.assertEqual(CHEMPAT_OID_2_NAME.get(_oid), name, err_msg)
 
+    def test_get_chempat_name(self):
+        """
+        GIVEN all known Chempat OIDs and a non-Chempat OID.
+        WHEN looking up the name by the last arc,
+        THEN is the same name returned as by the OID table.
+        """
+        for _oid, name in CHEMPAT_OID_2_NAME.items():
+            self.assertEqual(get_chempat_name(_oid), name)
+
+        _oid = COMPOSITE_KEM06_NAME_2_OID["composite-kem-ml-kem-768-x25519"]
+        self.assertIsNone(get_chempat_name(_oid))
+
     def test_composite_kem_06(self):
         """
         GIVEN all known composite KEM 06 algorithms.
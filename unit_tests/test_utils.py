@@ -34,6 +34,17 @@ class TestUtils(unittest.TestCase):
         nonces_diverse = [b"\x00" * 16, b"\xff" * 16]
         utils.nonces_must_be_diverse(nonces_diverse)
 
+    def test_nonces_must_be_diverse_different_lengths(self):
+        """
+        GIVEN a list of nonces with different lengths.
+        WHEN checking if the nonces are diverse,
+        THEN the shorter nonces are compared as if right-padded with zeros.
+        """
+        utils.nonces_must_be_diverse([b"\x00" * 8, b"\x00" * 8 + b"\xff" * 2])
+
+        with self.assertRaises(ValueError):
+            utils.nonces_must_be_diverse([b"\xff" * 8, b"\x00" * 16, b"\xff" * 8 + b"\x01"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -13,6 +13,9 @@ from resources.utils import load_and_decode_pem_file
 from unit_tests.utils_for_test import try_encode_pyasn1
 from resources.asn1utils import try_decode_pyasn1
 
+# The decoder only reads the schema, so one instance is shared by all tests.
+_CHALLENGE_SPEC = ChallengeASN1()
+
 
 class TestPrepareChallengeEncRand(unittest.TestCase):
 
@@ -21,6 +24,8 @@ class TestPrepareChallengeEncRand(unittest.TestCase):
     def setUpClass(cls):
         cls.rsa_key = load_private_key_from_file("./data/keys/private-key-rsa.pem", password=None)
         cls.mlkem_key = load_private_key_from_file("./data/keys/private-key-ml-kem-768-seed.pem")
+        cls.xwing_key = load_private_key_from_file("./data/keys/private-key-xwing-seed.pem")
+        cls.xwing_key_other = load_private_key_from_file("./data/keys/private-key-xwing-other-seed.pem")
 
     def test_prepare_with_rsa(self):
         """
@@ -32,7 +37,7 @@ class TestPrepareChallengeEncRand(unittest.TestCase):
                                                rand_sender="CN=Hans the Tester")
 
         der_data = try_encode_pyasn1(challenge)
-        decoded_obj, rest = try_decode_pyasn1(der_data, asn1_spec=ChallengeASN1())
+        decoded_obj, rest = try_decode_pyasn1(der_data, asn1_spec=_CHALLENGE_SPEC)
         self.assertEqual(rest, b"")
 
     def test_prepare_with_kem(self):
@@ -48,7 +53,7 @@ class TestPrepareChallengeEncRand(unittest.TestCase):
                                                )
 
         der_data = try_encode_pyasn1(challenge)
-        decoded_obj, rest = try_decode_pyasn1(der_data, asn1_spec=ChallengeASN1())
+        decoded_obj, rest = try_decode_pyasn1(der_data, asn1_spec=_CHALLENGE_SPEC)
         self.assertEqual(rest, b"")
 
 
@@ -58,10 +63,8 @@ class TestPrepareChallengeEncRand(unittest.TestCase):
         WHEN preparing a challenge with XWing.
         THEN the challenge is valid.
         """
-        xwing_key = load_private_key_from_file("./data/keys/private-key-xwing-seed.pem")
-        xwing_key_other = load_private_key_from_file("./data/keys/private-key-xwing-other-seed.pem")
-        challenge = prepare_challenge_enc_rand(public_key=xwing_key.public_key(),
-                                               rand_sender="CN=Hans the Tester", hybrid_kem_key=xwing_key_other)
+        challenge = prepare_challenge_enc_rand(public_key=self.xwing_key.public_key(),
+                                               rand_sender="CN=Hans the Tester", hybrid_kem_key=self.xwing_key_other)
         der_data = encoder.encode(challenge)
-        decoded_obj, rest = try_decode_pyasn1(der_data, asn1_spec=ChallengeASN1())
+        decoded_obj, rest = try_decode_pyasn1(der_data, asn1_spec=_CHALLENGE_SPEC)
         self.assertEqual(rest, b"")
@@ -14,9 +14,16 @@ from resources.utils import manipulate_first_byte
 
 class TestSLHDSASignAndVerify(unittest.TestCase):
 
-    def setUp(self):
-        self.slh_dsa_key = PQKeyFactory.generate_pq_key("slh-dsa")
-        self.data = os.urandom(1024)
+    @classmethod
+    def setUpClass(cls):
+        cls.slh_dsa_key = PQKeyFactory.generate_pq_key("slh-dsa")
+        cls.slh_dsa_pub = cls.slh_dsa_key.public_key()
+        cls.data = os.urandom(1024)
+        # SLH-DSA signing is slow, so every signature is created once and shared by the tests.
+        cls.signatures = {
+            hash_alg: sign_data(cls.data, cls.slh_dsa_key, hash_alg=hash_alg)
+            for hash_alg in (None, "sha256", "shake128", "shake256")
+        }
 
 
     def test_slh_dsa_sign_without_alg(self):
@@ -25,48 +32,24 @@ class TestSLHDSASignAndVerify(unittest.TestCase):
         WHEN data is signed without specifying a hash algorithm.
         THEN the signature should be successfully verified.
         """
-        signature = sign_data(self.data, self.slh_dsa_key)
+        signature = self.signatures[None]
         verify_signature(signature=signature, data=self.data,
-                         public_key=self.slh_dsa_key.public_key())
+                         public_key=self.slh_dsa_pub)
 
 
-    def test_slh_dsa_sign_with_sha256(self):
+    def test_slh_dsa_sign_with_hash_algs(self):
         """
         GIVEN a SLH-DSA key.
-        WHEN data is signed with SHA256.
+        WHEN data is signed with SHA256, SHAKE128 or SHAKE256.
         THEN the signature should be successfully verified.
         """
-        signature = sign_data(self.data, self.slh_dsa_key, hash_alg="sha256")
-        verify_signature(signature=signature,
-                         data=self.data,
-                         public_key=self.slh_dsa_key.public_key(),
-                         hash_alg="sha256")
-
-    def test_slh_dsa_sign_with_shake128(self):
-        """
-        GIVEN a SLH-DSA key.
-        WHEN data is signed with SHAKE128.
-        THEN the signature should be successfully verified.
-        """
-        signature = sign_data(self.data, self.slh_dsa_key, hash_alg="shake128")
-        verify_signature(signature=signature,
-                         data=self.data,
-                         public_key=self.slh_dsa_key.public_key(),
-                         hash_alg="shake128")
-
-
-
-    def test_slh_dsa_sign_with_shake256(self):
-        """
-        GIVEN a SLH-DSA key.
-        WHEN data is signed with SHAKE256.
-        THEN the signature should be successfully verified.
-        """
-        signature = sign_data(self.data, self.slh_dsa_key, hash_alg="shake256")
-        verify_signature(signature=signature,
-                         data=self.data,
-                         public_key=self.slh_dsa_key.public_key(),
-                         hash_alg="shake256")
+        for hash_alg in ("sha256", "shake128", "shake256"):
+            with self.subTest(hash_alg=hash_alg):
+                signature = self.signatures[hash_alg]
+                verify_signature(signature=signature,
+                                 data=self.data,
+                                 public_key=self.slh_dsa_pub,
+                                 hash_alg=hash_alg)
 
     def test_invalid_signature(self):
         """
@@ -74,11 +57,11 @@ class TestSLHDSASignAndVerify(unittest.TestCase):
         WHEN an invalid signature is provided.
         THEN the signature verification should fail.
         """
-        signature = sign_data(self.data, self.slh_dsa_key)
+        signature = self.signatures[None]
         signature = manipulate_first_byte(signature)
         with self.assertRaises(InvalidSignature):
             verify_signature(signature=signature, data=self.data,
-                             public_key=self.slh_dsa_key.public_key())
+                             public_key=self.slh_dsa_pub)
 
 
     def test_invalid_signature_with_shake256(self):
@@ -87,8 +70,8 @@ class TestSLHDSASignAndVerify(unittest.TestCase):
         WHEN an invalid signature is provided.
         THEN the signature verification should fail.
         """
-        signature = sign_data(self.data, self.slh_dsa_key, hash_alg="shake256")
+        signature = self.signatures["shake256"]
         signature = manipulate_first_byte(signature)
         with self.assertRaises(InvalidSignature):
             verify_signature(signature=signature, data=self.data,
-                             public_key=self.slh_dsa_key.public_key(), hash_alg="shake256")
+                             public_key=self.slh_dsa_pub, hash_alg="shake256")